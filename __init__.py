@@ -1,8 +1,12 @@
 """Top-level package for Data Plane."""
+import os
 import sys
 
-sys.path.append('.')
-sys.path.append('./data_plane')
+# The modules of the package import each other as dataplane and data_plane_server, so
+# the directory of the package goes on the path when the package is imported
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+if _PACKAGE_DIRECTORY not in sys.path:
+    sys.path.append(_PACKAGE_DIRECTORY)
 
 __author__ = """Rick McGeer"""
 __email__ = 'rick.mcgeer@engageLively.com'
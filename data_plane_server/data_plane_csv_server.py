@@ -47,13 +47,79 @@ After that, requests for the named table will be served by the created data serv
 
 
 import csv
-
-import pandas as pd
+import os
+from itertools import islice
 
 from dataplane.data_plane_utils import DATA_PLANE_SCHEMA_TYPES, InvalidDataException
-from dataplane.data_plane_table import DataPlaneTable, RowTable
+from dataplane.data_plane_table import RowTable
 from data_plane_server.table_server import Table
-from dataplane.conversion_utils import convert_row
+from dataplane.conversion_utils import convert_column
+
+
+# Parsed CSV files, indexed by the absolute path of the file.  Each entry is a
+# tuple (mtime_ns, size, schema, columns).  An entry is only used if the file's
+# modification time and size still match, so an edited file is re-read.  At most
+# _CSV_CACHE_SIZE files are held; the one read longest ago is dropped first
+_csv_cache = {}
+_CSV_CACHE_SIZE = 8
+
+# The number of data rows _read_csv_file reads from a file at a time
+_CSV_BLOCK_SIZE = 8192
+
+def _read_csv_file(path_to_csv_file):
+    # Internal use.  Read and convert a CSV file in the format described in
+    # create_server_from_csv.  Returns a pair (schema, columns).  The header and
+    # type rows are checked before any data rows are read, so a file with a bad
+    # schema fails without reading the rest of the file.  The data rows are
+    # read in blocks of _CSV_BLOCK_SIZE rows, and each block is appended to the
+    # columns and then dropped, so the whole file is never held as a list of rows.
+    # Each column is then converted as a whole, so the type conversion is looked
+    # up once per column rather than once per entry.
+    # Raises an InvalidDataException if the file is badly formed or a conversion fails
+    try:
+        with open(path_to_csv_file, 'r') as f:
+            r = csv.reader(f)
+            header = next(r)
+            type_row = next(r)
+            num_columns = len(header)
+            assert len(type_row) == num_columns
+            columns = [entry.strip() for entry in header]
+            types = [entry.strip() for entry in type_row]
+            for entry in types: assert entry in DATA_PLANE_SCHEMA_TYPES
+            raw_columns = [[] for i in range(num_columns)]
+            for block in iter(lambda: list(islice(r, _CSV_BLOCK_SIZE)), []):
+                for row in block: assert len(row) == num_columns
+                for (column, values) in zip(raw_columns, zip(*block)):
+                    column.extend(values)
+        assert num_columns == 0 or len(raw_columns[0]) > 0
+    except Exception as error:
+        raise InvalidDataException(error)
+    
+    schema = [{"name": columns[i], "type": types[i]} for i in range(num_columns)]
+    try:
+        final_columns = [convert_column(column, {"type": data_plane_type}) for (column, data_plane_type) in zip(raw_columns, types)]
+    except ValueError as error:
+        raise InvalidDataException(f'{error} raised during type conversion')
+    return (schema, final_columns)
+
+def _load_csv_file(path_to_csv_file):
+    # Internal use.  Return the (schema, columns) pair for path_to_csv_file, reading
+    # and converting the file only if it hasn't been read before or has changed
+    # since it was last read.
+    path = os.path.abspath(path_to_csv_file)
+    try:
+        stat = os.stat(path)
+    except OSError as error:
+        raise InvalidDataException(error)
+    entry = _csv_cache.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return (entry[2], entry[3])
+    (schema, columns) = _read_csv_file(path)
+    _csv_cache.pop(path, None)
+    _csv_cache[path] = (stat.st_mtime_ns, stat.st_size, schema, columns)
+    while len(_csv_cache) > _CSV_CACHE_SIZE:
+        _csv_cache.pop(next(iter(_csv_cache)), None)
+    return (schema, columns)
 
 
 def create_server_from_csv(table_name, path_to_csv_file, table_server, headers = {}):
@@ -65,6 +131,8 @@ def create_server_from_csv(table_name, path_to_csv_file, table_server, headers =
     4. The type of each entry in rows 2-n must match the declared type of the column
     Note that it is expected that the csv file will have been appropriately conditioned; all
     of the elements in each numeric column are numbers, and dates, times, and datetimes are in isoformat
+    The parsed file is cached, so creating several servers from the same, unchanged, file only
+    reads and converts it once.
     Arguments:
          table_name: the name of the table to add
          path_to_csv_file: the path to the csv file to read
@@ -72,46 +140,7 @@ def create_server_from_csv(table_name, path_to_csv_file, table_server, headers =
          headers: any authorization headers (default {})
 
     '''
-    try:
-        with open(path_to_csv_file, 'r') as f:
-            r = csv.reader(f)
-            rows = [row for row in r]
-        assert len(rows) > 2
-        num_columns = len(rows[0])
-        columns = [entry.strip() for entry in rows[0]]
-        for row in rows[1:]: assert len(row) == num_columns
-        types = [entry.strip() for entry in rows[1]]
-        for entry in types: assert entry in DATA_PLANE_SCHEMA_TYPES
-    except Exception as error:
-        raise InvalidDataException(error)
-    
-    schema = [{"name": columns[i], "type": types[i]} for i in range(num_columns)]
-    column_type_list = [{"type": data_plane_type} for data_plane_type in types]
-    try:
-        final_rows = [convert_row( row, column_type_list) for row in rows[2:]]
-        data_plane_table = RowTable(schema, final_rows)
-        data_server_table = Table(data_plane_table, headers)
-        table_server.add_data_plane_table({"name": table_name, "table": data_server_table})
-
-    except ValueError as error:
-        raise InvalidDataException(f'{error} raised during type conversion')
-    
-class RemoteCSVTable(DataPlaneTable):
-    '''
-    A very common format for data interchange on the Internet is a downloadable
-    CSV file.  It's so common it's worth making a class, just for this.  The
-    idea is that, when a get_rows request comes in, we download the table
-    into a dataframe and then return the list of rows, perhaps after doing
-    unit conversion
-    '''
-
-    def __init__(self, schema, url):
-        super(schema, self.get_rows)
-        self.url = url
-        self.dataframe = None
-
-    def get_rows(self):
-        if self.dataFrame is None:
-            self.dataframe = pd.read_csv(self.url)
-        return self.dataframe.values.tolist()
-    
\ No newline at end of file
+    (schema, columns) = _load_csv_file(path_to_csv_file)
+    data_plane_table = RowTable.from_columns(schema, columns)
+    data_server_table = Table(data_plane_table, headers)
+    table_server.add_data_plane_table({"name": table_name, "table": data_server_table})
@@ -45,20 +45,37 @@ After that, requests for the named table will be served by the created data serv
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import gzip
 import logging
 import os
-from json import JSONDecodeError, loads
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
+from hashlib import sha1
+from json import dumps
 
 import pandas as pd
 
-from flask import Blueprint, abort, jsonify, request
+from flask import Blueprint, abort, current_app, jsonify, request
+
+# orjson is optional.  If it's installed, responses are serialized with it, which is much faster
+# than the standard library encoder used by jsonify and handles dates, times and datetimes itself.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional.  If it's installed, clients which accept zstd get zstd-compressed
+# responses from /get_filtered_rows; otherwise gzip is used
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 from dataplane.data_plane_utils import DATA_PLANE_NUMBER, DATA_PLANE_DATE, DATA_PLANE_DATETIME, DATA_PLANE_TIME_OF_DAY
 
 from dataplane.data_plane_utils import InvalidDataException
-from dataplane.data_plane_table import  check_valid_spec
+from dataplane.data_plane_table import  DataFrameTable, RowTable, check_valid_spec
 from data_plane_server.table_server import TableServer, TableNotFoundException, TableNotAuthorizedException, ColumnNotFoundException, build_table_spec
 
 data_plane_server_blueprint = Blueprint('data_plane_server', __name__)
@@ -67,6 +84,25 @@ table_server = TableServer()
 
 NON_JSONIFIABLE_TYPES =  {DATA_PLANE_DATE, DATA_PLANE_TIME_OF_DAY, DATA_PLANE_DATETIME}
 
+# Values derived from the set of tables being served: the auth spec, the table dictionaries
+# returned by /get_tables (indexed by the tuple of names of the tables authorized for the request).
+# These only change when table_server changes,
+# so they are valid only while version matches table_server.version
+_metadata_cache = {"version": None, "auth_spec": None, "tables": {}}
+
+# Responses to /get_filtered_rows for tables which hold their own data (RowTables and DataFrameTables),
+# indexed by the key from _filtered_rows_cache_key, which includes the table's data_version.  Each entry
+# is a dictionary {encoding: body} (see _encoded_response).  The oldest entries are dropped when there
+# are more than _FILTERED_ROWS_CACHE_SIZE, or their bodies total more than _FILTERED_ROWS_CACHE_BYTES;
+# a response bigger than that on its own isn't cached
+_STATIC_TABLE_TYPES = (RowTable, DataFrameTable)
+_FILTERED_ROWS_CACHE_SIZE = 64
+_FILTERED_ROWS_CACHE_BYTES = 64 * 1024 * 1024
+_filtered_rows_cache = {}
+
+# Response bodies shorter than this (in bytes) are sent uncompressed
+_COMPRESSION_THRESHOLD = 1024
+
 def _log_and_abort(message, code = 400):
     '''
     Sent an abort with error code (defaut 400) and log the error message.  Utility, internal use only
@@ -77,6 +113,138 @@ def _log_and_abort(message, code = 400):
     logging.error(message)
     abort(code, message)
 
+def _orjson_default(value):
+    '''
+    Internal use.  The default function passed to orjson.dumps, called for values orjson doesn't
+    serialize natively (e.g., pandas Timestamps).  Anything with an isoformat method is sent as
+    its isoformat string
+    '''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError
+
+def _json_response(result):
+    '''
+    Internal use.  Return result as a JSON response.  This is jsonify(result) unless orjson is
+    installed, in which case result is serialized with orjson.  The keys of dictionaries are
+    sorted, as jsonify does
+    Arguments:
+        result: the value to send
+    '''
+    if orjson is None:
+        return jsonify(result)
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+    return current_app.response_class(orjson.dumps(result, default = _orjson_default, option = options), mimetype = current_app.json.mimetype)
+
+def _get_metadata_cache():
+    '''
+    Internal use.  Return _metadata_cache, first clearing it if table_server has changed since
+    it was filled
+    '''
+    if _metadata_cache["version"] != table_server.version:
+        _metadata_cache["version"] = table_server.version
+        _metadata_cache["auth_spec"] = table_server.get_auth_spec()
+        _metadata_cache["tables"] = {}
+    return _metadata_cache
+
+def _conditional_response(result):
+    '''
+    Internal use.  Jsonify result with an ETag computed from the body; if the request's
+    If-None-Match matches the ETag, this becomes a 304 with no body.  The ETag depends only
+    on the content, so it changes whenever the content does, even across server restarts
+    Arguments:
+        result: the value to jsonify
+    '''
+    response = _json_response(result)
+    response.set_etag(sha1(response.get_data()).hexdigest())
+    return response.make_conditional(request)
+
+def _filtered_rows_cache_key(table_name, table, filter_spec, columns, page):
+    '''
+    Internal use.  Return the key for the /get_filtered_rows response cache, or None if the
+    response can't be cached because the table isn't one of _STATIC_TABLE_TYPES.  The key
+    includes table_server.version and the table's data_version, so entries are never used after
+    the tables or the table's data change
+    Arguments:
+        table_name: the name of the table
+        table: the table
+        filter_spec: the filter spec of the request (may be None)
+        columns: the requested columns
+        page: the offset and limit of the request, as a dictionary
+    '''
+    if not isinstance(table, _STATIC_TABLE_TYPES):
+        return None
+    return (
+        table_server.version, table_name, table.data_version, dumps(filter_spec, sort_keys = True),
+        tuple(columns), page.get('offset', 0), page.get('limit')
+    )
+
+def _cache_entry_size(entry):
+    '''
+    Internal use.  The number of bytes held by a _filtered_rows_cache entry, in all its encodings.
+    Another request may add an encoding to the entry meanwhile (see _encoded_response), so the
+    bodies are summed from a snapshot of the entry
+    '''
+    return sum(len(body) for body in list(entry.values()))
+
+def _cache_filtered_rows(key, entry):
+    '''
+    Internal use.  Add entry to _filtered_rows_cache under key, dropping the oldest entries if the
+    cache has too many entries or bytes.  An entry bigger than _FILTERED_ROWS_CACHE_BYTES isn't added
+    '''
+    if _cache_entry_size(entry) > _FILTERED_ROWS_CACHE_BYTES:
+        return
+    _filtered_rows_cache[key] = entry
+    _trim_filtered_rows_cache()
+
+def _trim_filtered_rows_cache():
+    '''
+    Internal use.  Drop the oldest entries of _filtered_rows_cache until there are at most
+    _FILTERED_ROWS_CACHE_SIZE, holding at most _FILTERED_ROWS_CACHE_BYTES.  This is called when
+    an entry is added, and when an entry grows by a compressed body (see _encoded_response)
+    '''
+    while len(_filtered_rows_cache) > 0 and (len(_filtered_rows_cache) > _FILTERED_ROWS_CACHE_SIZE or \
+            sum(_cache_entry_size(cached) for cached in list(_filtered_rows_cache.values())) > _FILTERED_ROWS_CACHE_BYTES):
+        _filtered_rows_cache.pop(next(iter(_filtered_rows_cache)), None)
+
+def _response_encoding(body):
+    '''
+    Internal use.  Choose the Content-Encoding for a response body: zstd if zstandard is installed and
+    the client accepts it, otherwise gzip if the client accepts it.  Bodies shorter than
+    _COMPRESSION_THRESHOLD aren't compressed.  Returns None for no compression
+    '''
+    if len(body) < _COMPRESSION_THRESHOLD:
+        return None
+    if zstandard is not None and 'zstd' in request.accept_encodings:
+        return 'zstd'
+    if 'gzip' in request.accept_encodings:
+        return 'gzip'
+    return None
+
+def _encoded_response(entry):
+    '''
+    Internal use.  Return the JSON response for a /get_filtered_rows cache entry, compressed if the
+    client accepts it.  entry is a dictionary {encoding: body}, which always has the uncompressed
+    body under "identity"; a compressed body is computed the first time it's needed and kept in entry,
+    so an identical request later is served without compressing again
+    Arguments:
+        entry: the cache entry
+    '''
+    encoding = _response_encoding(entry["identity"])
+    if encoding is None:
+        response = current_app.response_class(entry["identity"], mimetype = current_app.json.mimetype)
+    else:
+        if encoding not in entry:
+            if encoding == 'zstd':
+                entry[encoding] = zstandard.ZstdCompressor(level = 3).compress(entry["identity"])
+            else:
+                entry[encoding] = gzip.compress(entry["identity"], compresslevel = 6)
+            _trim_filtered_rows_cache()
+        response = current_app.response_class(entry[encoding], mimetype = current_app.json.mimetype)
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
 def _table_server_if_authorized(request_api, table_name):
     '''
     Utility for _get_table_server and _get_table_servers.  Get the server for  table_name and return it.
@@ -113,51 +281,59 @@ def _get_table(request_api):
 def _jsonifiable_value(value, column_type):
     '''
     Internal use.  Python doesn't jsonify dates, datetimes, or times properly, so
-    convert them to isoformat strings.  Return everything else as is
+    convert them to isoformat strings.  Return everything else (including None, the
+    range of an empty column) as is
     Arguments:
         value -- the value to be converted
         column_type -- the data plane type of the value
     Returns
         A jsonifiable form of the value
     '''
-    if column_type in NON_JSONIFIABLE_TYPES:
+    if column_type in NON_JSONIFIABLE_TYPES and value is not None:
         return value.isoformat()
     else:
         return value
 
-def _jsonifiable_row_(row, column_types):
+def _iso_column_indices(column_types):
     '''
-    Internal use.  Return the jsonified form of the row, using _jsonifiable_value for each element
+    Internal use.  Return the indices of the columns whose type is in NON_JSONIFIABLE_TYPES,
+    and so must be converted to isoformat strings before jsonification.  The column types are
+    constant for a response, so this is computed once per request rather than once per cell
     Arguments:
-        row -- the row to be converted
         column_types -- the types of each element of the row
     Returns
-        A row of jsonifiable values
+        The list of indices of the date, time, and datetime columns
     '''
-    return [_jsonifiable_value(row[i], column_types[i]) for i in range(len(row))]
-
+    return [i for i in range(len(column_types)) if column_types[i] in NON_JSONIFIABLE_TYPES]
 
-def _jsonifiable_rows_(rows, column_types):
+def _isoformat_columns(rows, iso_indices):
     '''
-    Internal use.  Return the jsonifiable form of the list of rows, using _jsonifiable_row for each row
+    Internal use.  Return a copy of rows with the values in the columns in iso_indices converted
+    to isoformat strings.  The rows are transposed once, only the columns in iso_indices are touched,
+    and the columns are zipped back into rows.  If iso_indices is empty, the rows are returned as is
     Arguments:
         rows -- the list of rows to be converted
-        column_types -- the types of each element of the row
+        iso_indices -- the indices of the columns to convert, from _iso_column_indices
     Returns
         A list of rows  of jsonified values
     '''
-    return [_jsonifiable_row_(row, column_types) for row in rows]
+    if len(iso_indices) == 0 or len(rows) == 0:
+        return rows
+    columns = list(zip(*rows))
+    for i in iso_indices:
+        columns[i] = [value.isoformat() for value in columns[i]]
+    return [list(row) for row in zip(*columns)]
 
 def _jsonifiable_column(column, column_type):
     '''
-    Internal use.  Return a jsonifiable version of the column of values, using _jsonifiable_value
-    to do the conversion.  We actually cheat a little, only calling _jsonifiable_value if column_type
-    is one od DATA_PLANE_TIME, DATA_PLANE_DATE, DATA_PLANE_DATETIME
+    Internal use.  Return a jsonifiable version of the column of values.  Since the type is the
+    same for the whole column, we only test it once: if column_type is one of DATA_PLANE_TIME,
+    DATA_PLANE_DATE, DATA_PLANE_DATETIME every value is converted to its isoformat string, and
+    otherwise the column is returned as is
     '''
-    if column_type in NON_JSONIFIABLE_TYPES:
-        return [_jsonifiable_value(value, column_type) for value in column]
-    else: 
+    if column_type not in NON_JSONIFIABLE_TYPES:
         return column
+    return [value.isoformat() for value in column]
     
 
 def _column_type(table_name, column):
@@ -191,7 +367,10 @@ def _column_types(table, columns):
     '''
     if columns == []:
         return table.column_types()
-    return [column["type"] for column in table.schema if column["name"] in columns]
+    # The types are returned in the order of columns, since that is the order of the columns
+    # returned by table.get_filtered_rows
+    types = table.schema_by_name
+    return [types[name] for name in dict.fromkeys(columns) if name in types]
     
 
 
@@ -209,47 +388,61 @@ def get_filtered_rows():
     '''
     Get the filtered rows from a request.   Gets the filter_spec from the filter  field in the body, the table name from the table field
     in the body.  If there is a columns field in the body, returns 
-    onlyt the named columns.  If there is no filter_spec, returns all rows using server.get_rows().  Aborts with a 400 if there is no table, or if check_valid_spec or get_filtered_rows throws an InvalidDataException, or if the filter_spec is not valid JSON.
+    onlyt the named columns.  If there are offset and limit fields, returns only that page of the rows.  If there is no filter_spec, returns all rows using server.get_rows().  Aborts with a 400 if there is no table, or if check_valid_spec or get_filtered_rows throws an InvalidDataException, or if the filter_spec is not valid JSON.
 
     Arguments:
         None
     Returns:
         The filtered rows as a JSONified list of lists
     '''
-    try:
-        data = request.get_json()
-        filter_spec =  data["filter"] if 'filter' in data else None
-        columns =  data["columns"] if 'columns' in data else []
-        try:
-            table_name = data["table"]
-        except KeyError:
-            _log_and_abort('table is a required parameter to get filtererd rows', 400)
-        
-    except JSONDecodeError as error:
-        _log_and_abort(f'Bad arguments to /get_filtered_rows.  Error {error.msg}')
+    # get_json returns None, rather than raising an error, if the body isn't valid JSON
+    data = request.get_json(silent = True, force = True)
+    if not isinstance(data, dict):
+        _log_and_abort('The body of /get_filtered_rows must be a JSON object', 400)
+    table_name = data.get('table')
+    if table_name is None:
+        _log_and_abort('table is a required parameter to get filtererd rows', 400)
+    filter_spec = data.get('filter')
+    columns = data.get('columns')
     table = _table_server_if_authorized('/get_filtered_rows', table_name)
     if columns is None: columns = []
     if not isinstance(columns, list):
-        _log_and_abort(f'Columns to /get_filtered_rows must be a list of strings, not {columns}, 400')
+        _log_and_abort(f'Columns to /get_filtered_rows must be a list of strings, not {columns}', 400)
     # Make sure that the columns are all valid columns of this table
-    names = table.column_names()
-    bad_columns = [column for column in columns if column not in names]
+    names = table.column_name_set
+    bad_columns = [column for column in columns if not isinstance(column, str) or column not in names]
     if (len(bad_columns) > 0):
         _log_and_abort(f'Bad Columns {bad_columns} sent to /get_filtered_rows, table {table_name}', 400)
+    # offset and limit are optional, and page through the rows which pass the filter.  They're
+    # only passed on to the table if they're present
+    page = {name: data[name] for name in ('offset', 'limit') if data.get(name) is not None}
+    bad_page = [name for (name, value) in page.items() if type(value) is not int or value < 0]
+    if len(bad_page) > 0:
+        _log_and_abort(f'{bad_page} to /get_filtered_rows must be non-negative integers', 400)
     
     # If there is no filter, just return the table's rows.  If
     # there is a filter, make sure it's valid and then return the filtered
-    # rows
-    if filter_spec is not None:
-        try:
-            check_valid_spec(filter_spec)
-        except InvalidDataException as invalid_error:
-            _log_and_abort(invalid_error)
-    result = table.get_filtered_rows(filter_spec = filter_spec, columns = columns)
-    types = _column_types(table, columns)
-    jsonifiable_result = _jsonifiable_rows_(result, types)
-
-    return jsonify(jsonifiable_result)
+    # rows.  A cached response was only stored after its filter was checked,
+    # so the check is skipped on a cache hit
+    key = _filtered_rows_cache_key(table_name, table, filter_spec, columns, page)
+    entry = _filtered_rows_cache.get(key) if key is not None else None
+    if entry is None:
+        if filter_spec is not None:
+            try:
+                check_valid_spec(filter_spec)
+            except InvalidDataException as invalid_error:
+                _log_and_abort(invalid_error)
+        result = table.get_filtered_rows(filter_spec = filter_spec, columns = columns, **page)
+        if orjson is not None:
+            # orjson writes dates, times and datetimes as isoformat strings itself
+            response = _json_response(result)
+        else:
+            types = _column_types(table, columns)
+            response = jsonify(_isoformat_columns(result, _iso_column_indices(types)))
+        entry = {"identity": response.get_data()}
+        if key is not None:
+            _cache_filtered_rows(key, entry)
+    return _encoded_response(entry)
         
 
 
@@ -288,7 +481,7 @@ def get_range_spec():
             "max_val": _jsonifiable_value(result["max_val"], type),
             "min_val": _jsonifiable_value(result["min_val"], type),
         }
-        return jsonify(jsonifiable_result)
+        return _json_response(jsonifiable_result)
     except TableNotAuthorizedException:
         _log_and_abort(f'Access to table {table_name} not authorized, request /get_range_spec', 403)
     except TableNotFoundException:
@@ -314,7 +507,7 @@ def get_all_values():
         result = table_server.get_all_values(table_name, column_name, request.headers)
         type = _column_type(table_name, column_name)
         jsonifiable_result = _jsonifiable_column(result, type)
-        return jsonify(jsonifiable_result)
+        return _json_response(jsonifiable_result)
     except TableNotAuthorizedException:
         _log_and_abort(f'Access to table {table_name} not authorized, request /get_all_values', 403)
     except TableNotFoundException:
@@ -322,6 +515,51 @@ def get_all_values():
     except ColumnNotFoundException: 
         _log_and_abort(f'No column {column_name} in table {table_name}, request /get_all_values', 400)
 
+@data_plane_server_blueprint.route('/get_column_metadata', methods=['POST'])
+def get_column_metadata():
+    '''
+    Target for the /get_column_metadata route.  Returns, in one response, the type, the sorted list of
+    distinct values, and the range spec of each column named in the columns field of the body (every
+    column of the table if there is no columns field), as a JSONified dictionary
+    {column_name: {"type", "all_values", "range_spec"}}.  This saves a client which sets up a control for
+    each column a /get_all_values and a /get_range_spec request per column.  range_spec is None for an
+    empty table.  Aborts with a 400 if the body isn't a JSON object, for a missing or unknown table, or a
+    bad column name, and a 403 if the table is not authorized.
+
+    Arrguments:
+            None
+    '''
+    data = request.get_json(silent = True, force = True)
+    if not isinstance(data, dict):
+        _log_and_abort('The body of /get_column_metadata must be a JSON object', 400)
+    table_name = data.get('table')
+    if table_name is None:
+        _log_and_abort('table is a required parameter to /get_column_metadata', 400)
+    table = _table_server_if_authorized('/get_column_metadata', table_name)
+    columns = data.get('columns')
+    if columns is None: columns = table.column_names()
+    if not isinstance(columns, list):
+        _log_and_abort(f'Columns to /get_column_metadata must be a list of strings, not {columns}', 400)
+    names = table.column_name_set
+    bad_columns = [column for column in columns if not isinstance(column, str) or column not in names]
+    if (len(bad_columns) > 0):
+        _log_and_abort(f'Bad Columns {bad_columns} sent to /get_column_metadata, table {table_name}', 400)
+    result = {}
+    for column_name in columns:
+        column_type = table.get_column_type(column_name)
+        all_values = table.all_values(column_name)
+        range_spec = None
+        if len(all_values) > 0:
+            range_spec = table.range_spec(column_name)
+            range_spec = {key: _jsonifiable_value(value, column_type) for (key, value) in range_spec.items()}
+        result[column_name] = {
+            "type": column_type,
+            "all_values": _jsonifiable_column(all_values, column_type),
+            "range_spec": range_spec
+        }
+    # The lists of distinct values can be long, so the response is compressed if the client accepts it
+    return _encoded_response({"identity": _json_response(result).get_data()})
+
 @data_plane_server_blueprint.route('/get_tables')
 def get_tables():
     '''
@@ -329,12 +567,17 @@ def get_tables():
     {table_name: <table_schema>}, where <table_schema> is a dictionary
     {"name": name, "type": type}
 
+    The dictionary only depends on which tables the request is authorized for, so it is
+    cached under the names of those tables until the set of tables changes.
+
     Arguments:
             None
     '''
-    items = table_server.get_table_dictionary(request.headers)
-
-    return jsonify(items)
+    cache = _get_metadata_cache()
+    key = tuple(table_server.get_authorized_table_names(request.headers))
+    if key not in cache["tables"]:
+        cache["tables"][key] = table_server.get_table_dictionary(request.headers)
+    return _conditional_response(cache["tables"][key])
 
 @data_plane_server_blueprint.route('/get_table_spec')
 def get_table_spec():
@@ -346,7 +589,8 @@ def get_table_spec():
          A dictionary of the form {table_name: list of required authorization variables}
 
     '''
-    return jsonify(table_server.get_auth_spec())
+    cache = _get_metadata_cache()
+    return _conditional_response(cache["auth_spec"])
 
 @data_plane_server_blueprint.route('/init', methods = ['POST', 'GET'])
 def init():
@@ -356,9 +600,13 @@ def init():
     
     if path is not None:
         files = glob(f'{path}/*.json')
-        for filename in files:
-            table_server.add_data_plane_table(build_table_spec(filename))
-    return jsonify(table_server.get_auth_spec())
+        # The files are independent, so read them in parallel.  The tables are registered
+        # one at a time afterwards, in file order
+        with ThreadPoolExecutor() as executor:
+            table_specs = list(executor.map(build_table_spec, files))
+        for table_spec in table_specs:
+            table_server.add_data_plane_table(table_spec)
+    return _json_response(table_server.get_auth_spec())
         
 
 
@@ -371,8 +619,9 @@ def show_routes():
     '''
     pages = [
             {"url": "/, /help", "headers": "", "method": "GET", "description": "print this message"},
+            {"url": "/get_column_metadata", "method": "POST", "body": {"table": "<i> required, the name of the table</i>", "columns": "<i> If  present, a list of the names of the columns; otherwise every column</i>"}, "headers": "<i> as required for authentication</i>", "description": 'Get the type, the sorted distinct values, and the range spec of each column in one request, as a dictionary {column_name: {"type", "all_values", "range_spec"}}'},
             {"url": "/get_tables", "method": "GET", "headers": "<i>as required for authentication</i>", "description": 'Dumps a JSONIfied dictionary of the form:{table_name: <table_schema>}, where <table_schema> is a dictionary{"name": name, "type": type}'},
-            {"url": "/get_filtered_rows?table_name<i>string, required</i>", "method": "POST", "body": {"table": "<i> required, the name of the table to get the rows from<i/>", "columns": "<i> If  present, a list of the names of the columns to fetch</i>","filter": "<i> optional, a filter_spec in the data plane filter language" }, "headers": "<i> as required for authentication</i>", "description": "Get the rows from table Table-Name (and, optionally, Dashboard-Name) which match filter Filter-Spec"},
+            {"url": "/get_filtered_rows?table_name<i>string, required</i>", "method": "POST", "body": {"table": "<i> required, the name of the table to get the rows from<i/>", "columns": "<i> If  present, a list of the names of the columns to fetch</i>","filter": "<i> optional, a filter_spec in the data plane filter language", "offset": "<i> optional, the number of matching rows to skip</i>", "limit": "<i> optional, the most rows to return</i>" }, "headers": "<i> as required for authentication</i>", "description": "Get the rows from table Table-Name (and, optionally, Dashboard-Name) which match filter Filter-Spec"},
             {"url": "/get_range_spec?column_name<i>string, required</i>&table_name<i>string, required</i>", "method": "GET", "headers":"<i>as required for authentication</i>", "description": "Get the  minimum, and maximumvalues for column <i>column_name</i> in table<i>table_name</i>, returned as a dictionary {min_val, max_val}."},
             {"url": "/get_all_values?column_name<i>string, required</i>&table_name<i>string, required</i>", "method": "GET", "headers": "<i>as required for authentication</i>", "description": "Get all the distinct values for column <i>column_name</i> in table <i>table_name</i>, returned as a sorted list.  Authentication variables shjould be in headers."},
             {"url": "/get_table_spec", "method": "GET", "description": "Return the dictionary of table names and authorization variables"},
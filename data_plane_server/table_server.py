@@ -46,12 +46,13 @@ After that, requests for the named table will be served by the created data serv
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from itertools import count
 from json import  load
 
 import pandas as pd
 
 from dataplane.data_plane_utils import InvalidDataException
-from dataplane.data_plane_table import RowTable, _convert_to_type
+from dataplane.data_plane_table import RowTable, _convert_list_to_type
 
 class TableNotFoundException(Exception):
     '''
@@ -75,10 +76,6 @@ class ColumnNotFoundException(Exception):
     def __init__(self, message):
         super().__init__(message)
 
-def _convert_row(row, types):
-    return [_convert_to_type(types[i], row[i]) for i in range(len(types))]
-
-
 
 def _check_headers(headers):
     '''
@@ -168,7 +165,8 @@ def build_table_spec(filename):
     a row is a list of lists values, each list the same length as the schema, and
        each value is of the type specified for the corresponding entry of
        the schema.  Date, Time, and Datetime entries ate in isoformat.
-    Note there is no error-checking
+    The only error-checking is that each row has an entry for each column of the schema;
+    if not, an InvalidDataException is raised
     Arguments:
         filename: name of the json file
     Returns:
@@ -180,8 +178,15 @@ def build_table_spec(filename):
     table = table_spec["table"]
     types = [column["type"] for column in table["schema"]]
     
-    rows = [_convert_row(row, types) for row in table["rows"]]
-    row_table = RowTable(table["schema"], rows)
+    # Convert a column at a time, so the converter for each column's type is looked up once.
+    # zip would silently drop the extra entries of long rows, or the entries beyond a short
+    # row, so the rows are checked against the schema first
+    bad_rows = [i for (i, row) in enumerate(table["rows"]) if len(row) != len(types)]
+    if len(bad_rows) > 0:
+        raise InvalidDataException(f'Rows {bad_rows} of table {table_spec["name"]} do not have {len(types)} entries')
+    columns = zip(*table["rows"])
+    converted = [_convert_list_to_type(column_type, list(column)) for (column_type, column) in zip(types, columns)]
+    row_table = RowTable.from_columns(table["schema"], converted)
     headers = table_spec['headers'] if 'headers' in table_spec else []
     return {
         "name": table_spec["name"],
@@ -202,15 +207,22 @@ def _check_table_spec(table_spec):
     _check_type(table_spec["table"], Table, 'The table in table_spec must be a Table, not')
     
 
+# Source of TableServer versions.  This is global rather than per-server so that
+# re-initializing a server (as /init does) never reuses a version number
+_table_server_versions = count()
+
 class TableServer:
     '''
     The server for tables.  Its task is to maintain a correspondence
     between table names and the actual tables.  It also maintains the security information for a table (the variables and values required to access the table), and gives column information across tables 
+    The version attribute changes whenever the set of tables changes, so callers can
+    cache anything derived from the tables and schemas and check it against the version.
     '''
 
     # Conceptually, there is only a single TableServer  (why would there #  be more?), and so this could be in a global variable and its # methods global. 
     def __init__(self):
         self.servers = {}
+        self.version = next(_table_server_versions)
 
     def get_table_dictionary(self, headers = {}):
         '''
@@ -228,6 +240,17 @@ class TableServer:
                 result[items[0]] = items[1].table.schema
         return result
     
+    def get_authorized_table_names(self, headers = {}):
+        '''
+        Get the names of the tables authorized with headers
+        Arguments:
+            headers: dictionary of header variables and values
+        Returns:
+            a list of the names of the authorized tables
+        '''
+        if headers is None: headers = {}
+        return [items[0] for items in self.servers.items() if items[1].authorized(headers)]
+
     def get_auth_spec(self):
         '''
         Return a dictionary of the names of the tables and the authorization variables required for head
@@ -265,6 +288,7 @@ class TableServer:
         '''
         _check_table_spec(table_spec)
         self.servers[table_spec["name"]] = table_spec["table"]
+        self.version = next(_table_server_versions)
     
     
     def get_table(self, table_name, headers = {}):
@@ -48,8 +48,12 @@ After that, requests for the named table will be served by the created data serv
 
 
 import datetime
+from itertools import repeat
 from math import nan
 
+import numpy as np
+import pandas as pd
+
 from dataplane.data_plane_utils import DATA_PLANE_BOOLEAN, DATA_PLANE_DATE, DATA_PLANE_DATETIME, DATA_PLANE_NUMBER, DATA_PLANE_STRING, DATA_PLANE_TIME_OF_DAY
 
 
@@ -59,6 +63,37 @@ contain strings as numbers, dates, and so forth, and these must be converted to
 data type on load.  
 '''
 
+# The parsers for isoformat strings of each of the date and time types.  These convert
+# a whole column of strings with map(), with no Python call per entry
+ISOFORMAT_PARSERS = {
+    DATA_PLANE_DATE: datetime.date.fromisoformat,
+    DATA_PLANE_DATETIME: datetime.datetime.fromisoformat,
+    DATA_PLANE_TIME_OF_DAY: datetime.time.fromisoformat
+}
+
+# The date and time classes and strptime, bound once for the scalar converters below
+_DATE = datetime.date
+_TIME = datetime.time
+_DATETIME = datetime.datetime
+_strptime = _DATETIME.strptime
+
+# The part of a datetime (from datetime.strptime) which is the value of each of the date and time types
+_DATETIME_PARTS = {
+    DATA_PLANE_DATE: _DATETIME.date,
+    DATA_PLANE_DATETIME: lambda dt: dt,
+    DATA_PLANE_TIME_OF_DAY: _DATETIME.time
+}
+
+def _parse_date_string(string, data_plane_type, format_string):
+    # Parse string to data_plane_type, which is one of DATA_PLANE_DATE, DATA_PLANE_DATETIME, and
+    # DATA_PLANE_TIME_OF_DAY.  If format_string is given, the string is parsed by strptime and the
+    # part of the datetime for data_plane_type is returned; if not, the string is parsed as isoformat.
+    # Raises ValueError if the string won't parse.  This is the string case of all the date and
+    # time converters
+    if format_string:
+        return _DATETIME_PARTS[data_plane_type](_strptime(string, format_string))
+    return ISOFORMAT_PARSERS[data_plane_type](string)
+
 def _convert_to_string(s):
    # handle lists, objects, etc
    return s if isinstance(s, str) else str(s) 
@@ -68,36 +103,44 @@ def _convert_to_number(x, default_value = nan):
     # is a parameter passed in, default to nan
     # Rules:
     #     1. If it's already a number, just return the number
-    #     2. Try to convert to a float  first.
-    #     3. If float  conversion fails, attempt to convert to an int
-    #     4. If everything fails, just return the default
-    # the problem with converting to an int first is that int(2.3) == 2
-    # which is not what we want to return
-    if default_value is None: default_value = nan
-    if (isinstance(x, int) or isinstance(x, float)):
+    #     2. Try to convert to a float
+    #     3. If that fails, just return the default
+    # There's no point trying int(x) when float(x) fails: every string int() parses,
+    # float() parses too.  A boolean is an int, but is converted to 1.0 or 0.0, as it
+    # is when a whole column is converted
+    if isinstance(x, (int, float)) and not isinstance(x, bool):
         return x
     try:
         return float(x)
-    except ValueError:
-        pass
-    try:
-        return int(x)
-    except ValueError:
-        return default_value
+    except (TypeError, ValueError):
+        return nan if default_value is None else default_value
     
+# The strings _convert_to_boolean converts to True.  "1" is not one of them: a CSV column
+# of 1s and 0s should be declared as a number
+_BOOLEAN_TRUE_STRINGS = frozenset({"True", "true", "t"})
+
+# The conversion to boolean for each of the common types of value, for _convert_to_boolean
+_BOOLEAN_CONVERTERS = {
+    bool: lambda b: b,
+    str: _BOOLEAN_TRUE_STRINGS.__contains__,
+    int: lambda i: i != 0,
+    float: lambda f: f != 0
+}
+
 def _convert_to_boolean(aBool, default_value = False):
     # convert aBool to a boolean, or default_value if not provided.  The rules are simple:
     # 1. if aBool is a boolean, return it
-    # 2. if aBool is a string, treturn True iff aBool is in {"True", "true", "1", "t"}
+    # 2. if aBool is a string, treturn True iff aBool is in _BOOLEAN_TRUE_STRINGS
     # 3. if aBool is a number, return True iff aBool != 0
     # 4. Otherwise, return the default value
-    if default_value is None: default_value = False
-    if type(aBool) == bool: return aBool
-    if type(aBool) == str:
-        return aBool in {"True", "true", "t"}
-    if (isinstance(aBool, int) or isinstance(aBool, float)):
+    # The common types are looked up in _BOOLEAN_CONVERTERS; subclasses of int and float
+    # (numpy scalars, for example) fall through to the isinstance check
+    converter = _BOOLEAN_CONVERTERS.get(type(aBool))
+    if converter is not None:
+        return converter(aBool)
+    if isinstance(aBool, (int, float)):
         return aBool != 0
-    return default_value
+    return False if default_value is None else default_value
 
 def _convert_to_time(t, format_string = None, default_value = datetime.time(0, 0, 0)):
     # Convert t to a time, or to the default value  if connversion fails.  The default_value
@@ -113,23 +156,17 @@ def _convert_to_time(t, format_string = None, default_value = datetime.time(0, 0
     #     4b. If it's a string and the format_string is not provided, use isoformat() to parse the string into a time
     #     4c. If it's a string and parsing fails, return  default_value
     #     5. If all else fails, return the default value
-    if default_value is None: default_value = datetime.time(0, 0, 0)
-    if isinstance(t, datetime.time):
-        return t
-    if isinstance(t, datetime.date):
-        return default_value
-    if isinstance(t, datetime.datetime):
-        return t.time()
+    # A datetime is also a date, so it's checked for first
+    if default_value is None: default_value = _TIME(0, 0, 0)
     if isinstance(t, str):
-        if format_string:
-            try:
-                return datetime.datetime.strptime(t, format_string).time()
-            except ValueError:
-                return default_value
         try:
-            return datetime.time.fromisoformat(t)
+            return _parse_date_string(t, DATA_PLANE_TIME_OF_DAY, format_string)
         except ValueError:
             return default_value
+    if isinstance(t, _TIME):
+        return t
+    if isinstance(t, _DATETIME):
+        return t.time()
     return default_value
 
 def _convert_to_date(d, format_string = None, default_value = datetime.date(1900, 1, 1)):
@@ -146,23 +183,17 @@ def _convert_to_date(d, format_string = None, default_value = datetime.date(1900
     #     4b. If it's a string and the format_string is not provided, use isoformat() to parse the string into a date
     #     4c. If it's a string and parsing fails, return  default_value
     #     5. If all else fails, return the default value
-    if default_value is None: default_value = datetime.date(1900, 1, 1)
-    if isinstance(d, datetime.date):
-        return d
-    if isinstance(d, datetime.time):
-        return default_value
-    if isinstance(d, datetime.datetime):
-        return d.date()
+    # A datetime is also a date, so it's checked for first
+    if default_value is None: default_value = _DATE(1900, 1, 1)
     if isinstance(d, str):
-        if format_string:
-            try:
-                return datetime.datetime.strptime(d, format_string).date()
-            except ValueError:
-                return default_value
         try:
-            return datetime.date.fromisoformat(d)
+            return _parse_date_string(d, DATA_PLANE_DATE, format_string)
         except ValueError:
             return default_value
+    if isinstance(d, _DATETIME):
+        return d.date()
+    if isinstance(d, _DATE):
+        return d
     return default_value
 
 def _convert_to_datetime(dt,  format_string = None, default_value = None):
@@ -179,50 +210,167 @@ def _convert_to_datetime(dt,  format_string = None, default_value = None):
     #     4b. If it's a string and the format_string is not provided, use isoformat() to parse the string into a datetime
     #     4c. If it's a string and parsing fails, return  default_value
     #     5. If all else fails, return the default value
-    if default_value is None: default_value = datetime.date(1900, 1, 1, 0, 0, 0)
-    if isinstance(dt, datetime.datetime):
-        return dt
-    if isinstance(dt, datetime.time):
-        return datetime.datetime(default_value.year, default_value.month, default_value.day, dt.hour, dt.minute, dt.second)
-    if isinstance(dt, datetime.date):
-        return datetime.datetime(dt.year, dt.month, dt.day, default_value.hour, default_value.minute, default_value.second)
+    if default_value is None: default_value = _DATETIME(1900, 1, 1, 0, 0, 0)
     if isinstance(dt, str):
-        if format_string:
-            try:
-                return datetime.datetime.strptime(dt, format_string)
-            except ValueError:
-                return default_value
         try:
-            return datetime.datetime.fromisoformat(dt)
+            return _parse_date_string(dt, DATA_PLANE_DATETIME, format_string)
         except ValueError:
             return default_value
+    if isinstance(dt, _DATETIME):
+        return dt
+    if isinstance(dt, _TIME):
+        return _DATETIME(default_value.year, default_value.month, default_value.day, dt.hour, dt.minute, dt.second)
+    if isinstance(dt, _DATE):
+        return _DATETIME(dt.year, dt.month, dt.day, default_value.hour, default_value.minute, default_value.second)
     return default_value
 
 
+# The pandas inferred types (see pandas.api.types.infer_dtype) of columns whose entries are all
+# ints and floats, and which can be converted to DATA_PLANE_NUMBER or DATA_PLANE_BOOLEAN in one
+# step.  A column of Decimals ('decimal') can be converted to DATA_PLANE_NUMBER in one step, but
+# not to DATA_PLANE_BOOLEAN: _convert_to_boolean gives a Decimal the default
+_NUMERIC_INFERRED_TYPES = frozenset({'integer', 'floating', 'mixed-integer-float'})
+
+# The pandas accessors which pull the DATA_PLANE_DATE and DATA_PLANE_TIME_OF_DAY parts out of
+# a column of timestamps
+_TIMESTAMP_PARTS = {
+    DATA_PLANE_DATE: lambda timestamps: timestamps.dt.date,
+    DATA_PLANE_DATETIME: lambda timestamps: timestamps.dt.to_pydatetime(),
+    DATA_PLANE_TIME_OF_DAY: lambda timestamps: timestamps.dt.time
+}
+
+# The scalar conversions of the date and time types, used for columns which can't be converted
+# in one step
+_SCALAR_DATE_CONVERTERS = {
+    DATA_PLANE_DATE: _convert_to_date,
+    DATA_PLANE_DATETIME: _convert_to_datetime,
+    DATA_PLANE_TIME_OF_DAY: _convert_to_time
+}
+
+def _coerce_numbers(series, inferred_type, default_value):
+    # Internal use by _coerce_types_in_series.  Convert series to DATA_PLANE_NUMBER.
+    # float() is what _convert_to_number tries first, and numpy applies it to the whole
+    # column at once.  numpy turns None into nan rather than the default, so only columns
+    # of numbers, booleans, or strings (which have no None entries) take that path; if some
+    # entry won't convert, the column is converted entry by entry, so that every string
+    # float() accepts (such as '1_000') converts as it does alone
+    if inferred_type in _NUMERIC_INFERRED_TYPES or inferred_type in ('decimal', 'boolean', 'string'):
+        try:
+            return np.asarray(series, dtype = float)
+        except (TypeError, ValueError):
+            pass
+    if default_value is None: default_value = nan
+    return np.fromiter(map(_convert_to_number, series, repeat(default_value)), dtype = float, count = len(series))
+
+def _coerce_booleans(series, inferred_type, default_value):
+    # Internal use by _coerce_types_in_series.  Convert series to DATA_PLANE_BOOLEAN,
+    # following the rules of _convert_to_boolean
+    if inferred_type == 'boolean':
+        return np.asarray(series, dtype = bool)
+    if inferred_type in _NUMERIC_INFERRED_TYPES:
+        return np.asarray(series, dtype = float) != 0
+    if inferred_type == 'string':
+        return pd.Series(series, dtype = object).isin(_BOOLEAN_TRUE_STRINGS).to_numpy()
+    if default_value is None: default_value = False
+    # np.fromiter with a count fills a preallocated array; map with repeat() passes the default
+    # to each call without a generator
+    return np.fromiter(map(_convert_to_boolean, series, repeat(default_value)), dtype = bool, count = len(series))
+
+def _make_date_string_parser(data_plane_type, format_string, default_value):
+    # Internal use by _coerce_dates.  Return a function which parses a string to data_plane_type,
+    # using format_string if there is one and isoformat if not, and returns default_value if
+    # the string won't parse.  This is _parse_date_string, with the choice of parser made
+    # once for the column rather than once per entry
+    if format_string:
+        part = _DATETIME_PARTS[data_plane_type]
+        parse_string = lambda string: part(_strptime(string, format_string))
+    else:
+        parse_string = ISOFORMAT_PARSERS[data_plane_type]
+    def parse(string):
+        try:
+            return parse_string(string)
+        except ValueError:
+            return default_value
+    return parse
+
+def _coerce_dates(series, inferred_type, data_plane_type, format_string, default_value):
+    # Internal use by _coerce_types_in_series.  Convert series to data_plane_type, which is
+    # one of DATA_PLANE_DATE, DATA_PLANE_DATETIME, and DATA_PLANE_TIME_OF_DAY.  Columns of
+    # strings are parsed in one step: by the isoformat parser if there's no format_string,
+    # and by pandas.to_datetime if there is.  Anything else is converted entry by entry
+    convert = _SCALAR_DATE_CONVERTERS[data_plane_type]
+    if inferred_type == 'string':
+        if format_string:
+            # pandas.to_datetime raises on some columns strptime parses (mixed %z offsets, for
+            # one), and gives NaT for dates outside the nanosecond Timestamp range; those
+            # columns, and the entries which come back NaT, are parsed by strptime
+            default_value = convert(None, None, default_value)
+            parse = _make_date_string_parser(data_plane_type, format_string, default_value)
+            strings = pd.Series(series, dtype = object)
+            try:
+                timestamps = pd.to_datetime(strings, format = format_string, errors = 'coerce')
+                values = pd.Series(_TIMESTAMP_PARTS[data_plane_type](timestamps), dtype = object)
+            except (TypeError, ValueError, OverflowError):
+                return np.fromiter(map(parse, series), dtype = object, count = len(series))
+            missing = timestamps.isna().to_numpy()
+            values = values.to_numpy(copy = True)
+            values[missing] = [parse(string) for string in strings.to_numpy()[missing]]
+            return values
+        try:
+            return np.fromiter(map(ISOFORMAT_PARSERS[data_plane_type], series), dtype = object, count = len(series))
+        except ValueError:
+            pass
+    # Entry by entry.  The default is worked out once, and strings, which are most of what
+    # comes through here, go to a parser specialized to data_plane_type and format_string
+    default_value = convert(None, None, default_value)
+    parse = _make_date_string_parser(data_plane_type, format_string, default_value)
+    values = (parse(x) if isinstance(x, str) else convert(x, format_string, default_value) for x in series)
+    return np.fromiter(values, dtype = object, count = len(series))
+
+# A string column with fewer distinct values than this fraction of its length is
+# returned with one string object per distinct value, shared by all its entries
+_SHARED_STRINGS_RATIO = 0.05
+
+def _share_repeated_strings(strings):
+    # Internal use by _coerce_types_in_series.  strings is a numpy object array of strings.
+    # If the column has few distinct values (a category, a state, a country...), return it
+    # with each entry referring to the single copy of its value, rather than to its own
+    # copy, which can be most of the memory of a large table read from a file
+    (codes, uniques) = pd.factorize(strings)
+    if len(uniques) >= _SHARED_STRINGS_RATIO * len(strings):
+        return strings
+    return uniques.take(codes)
+
 def _coerce_types_in_series(series, data_plane_type, format_string = None, column_default = None):
     # Internal use, coercing a column (from a CSV or a dataframe) to the
     # desired data plane type.
     # ATM, no heroic conversion is being done -- eventually we will have to
     # add a pretty significant ETL component
+    # The column is converted in one step where its entries are all of one kind (all
+    # strings, all numbers...), which pandas infers in a single pass.  The result is
+    # a numpy array: float64 for DATA_PLANE_NUMBER, bool for DATA_PLANE_BOOLEAN, and
+    # object (strings or datetime objects) for the other types
+    inferred_type = pd.api.types.infer_dtype(series, skipna = False)
     if data_plane_type == DATA_PLANE_STRING:
-        return [_convert_to_string(x) for x in series]
+        # np.asarray would make a column of equal-length lists into a 2-D array
+        strings = np.empty(len(series), dtype = object)
+        strings[:] = series
+        if inferred_type != 'string':
+            strings = np.fromiter(map(_convert_to_string, strings), dtype = object, count = len(strings))
+        return _share_repeated_strings(strings)
     if data_plane_type == DATA_PLANE_NUMBER:
-        return [_convert_to_number(x, column_default) for x in series]
+        return _coerce_numbers(series, inferred_type, column_default)
     if data_plane_type == DATA_PLANE_BOOLEAN:
-        return [_convert_to_boolean(b, column_default) for b in series]
-    if data_plane_type == DATA_PLANE_TIME_OF_DAY:
-        return [_convert_to_time(t, format_string, column_default) for t in series]
-    if data_plane_type == DATA_PLANE_DATE:
-        return [_convert_to_date(d, format_string, column_default) for d in series]
-    if data_plane_type == DATA_PLANE_DATETIME:
-        return [_convert_to_datetime(dt, format_string, column_default) for dt in series]
+        return _coerce_booleans(series, inferred_type, column_default)
+    if data_plane_type in _SCALAR_DATE_CONVERTERS:
+        return _coerce_dates(series, inferred_type, data_plane_type, format_string, column_default)
     
 def _convert_default_value(data_plane_type, format_string, default_value ):
     # A utility to convert the given default_value to one of the right type.
     # This is because the default_value may come in a string (consider a CSV file)
     # ATM only converts strings
     if default_value is None: return None
-    if type(default_value) != str: return default_value
+    if type(default_value) is not str: return default_value
     if data_plane_type == DATA_PLANE_STRING:
         return default_value
     if data_plane_type == DATA_PLANE_NUMBER:
@@ -238,10 +386,34 @@ def _convert_default_value(data_plane_type, format_string, default_value ):
 
     
 
-def _get_safe(object, key):
-    return object[key] if key in object.keys() else None
-
-
+def compile_element_converter(type_conversion_object):
+    '''
+    Build a function of one argument which converts an element as convert_element(element, type_conversion_object)
+    does.  The format_string and the converted default_value are worked out here, once, rather than
+    on every conversion, so use this rather than convert_element to convert many elements the same way.
+    Parameters:
+        type_conversion_object: a conversion object as described in convert_element
+    Returns:
+        a function which takes an element and returns it converted into the appropriate type
+    '''
+    format_string = type_conversion_object.get("format_string")
+    default_value = type_conversion_object.get("default_value")
+    data_plane_type = type_conversion_object["type"]
+    # Make sure the default_value is the appropriate t ype
+    default_value = _convert_default_value(data_plane_type, format_string, default_value)
+    if data_plane_type == DATA_PLANE_STRING:
+        return _convert_to_string
+    if data_plane_type == DATA_PLANE_NUMBER:
+        return lambda element: _convert_to_number(element, default_value)
+    if data_plane_type == DATA_PLANE_BOOLEAN:
+        return lambda element: _convert_to_boolean(element, default_value)
+    if data_plane_type == DATA_PLANE_TIME_OF_DAY:
+        return lambda element: _convert_to_time(element, format_string, default_value)
+    if data_plane_type == DATA_PLANE_DATE:
+        return lambda element: _convert_to_date(element, format_string, default_value)
+    if data_plane_type == DATA_PLANE_DATETIME:
+        return lambda element: _convert_to_datetime(element, format_string, default_value)
+    return lambda element: None
 
 def convert_element(element, type_conversion_object):
     '''
@@ -254,44 +426,69 @@ def convert_element(element, type_conversion_object):
     is a string, then the default_value will be converted to the appropriate type.
     For example, {"type": DATA_PLANE_DATE, "format_string": "%m/%d/%Y", "default_value": "12/1//2000"}
     will convert the element to a date, parsing strings as mm/dd/yyyy, and with a default of December 1, 2000
+    To convert many elements with the same type_conversion_object, use compile_element_converter,
+    which converts the default_value only once.
     Parameters:
         element -- the element to be converted
         type_conversion_object: a conversion object as described above
     Returns:
         the element converted into the appropriate type
     '''
-    format_string = _get_safe(type_conversion_object, "format_string")
-    default_value = _get_safe(type_conversion_object, "default_value")
-    data_plane_type = type_conversion_object["type"]
-    # Make sure the default_value is the appropriate t ype
-    default_value = _convert_default_value(data_plane_type, format_string, default_value)
-    if data_plane_type == DATA_PLANE_STRING:
-        return _convert_to_string(element)
-    if data_plane_type == DATA_PLANE_NUMBER:
-        return _convert_to_number(element, default_value)
-    if data_plane_type == DATA_PLANE_BOOLEAN:
-        return _convert_to_boolean(element, default_value) 
-    if data_plane_type == DATA_PLANE_TIME_OF_DAY:
-        return _convert_to_time(element, format_string, default_value)
-    if data_plane_type == DATA_PLANE_DATE:
-        return _convert_to_date(element, format_string, default_value)
-    if data_plane_type == DATA_PLANE_DATETIME:
-        return _convert_to_datetime(element, format_string, default_value)
-    
+    return compile_element_converter(type_conversion_object)(element)
+
+def compile_row_converter(type_conversion_object_list):
+    '''
+    Build the converters for a list of type_conversion_objects, for use with convert_row.  Each
+    column's format_string and default_value are worked out once here, so converting many rows
+    with the result is much cheaper than passing type_conversion_object_list to convert_row
+    for each row.
+    Parameters:
+        type_conversion_object_list -- a list of type_conversion_objects, one per column
+    Returns:
+        a list of converters, one per column, which can be passed to convert_row
+    '''
+    return [compile_element_converter(type_conversion_object) for type_conversion_object in type_conversion_object_list]
 
 def convert_row(row, type_conversion_object_list):
     '''
     Convert a row (as a list) to the appropriate types given by the corresponding type_conversion_object
     Parameters: 
        row -- the row to be converted
-       type_conversion_object_list -- a list (length of the row) of type_conversion_objects to guide the conversion
+       type_conversion_object_list -- a list (length of the row) of type_conversion_objects to guide the conversion,
+           or the result of compile_row_converter on such a list
     '''
-    
-    return [convert_element(row[i], type_conversion_object_list[i]) for i in range(len(type_conversion_object_list))]
+    converters = type_conversion_object_list
+    if len(converters) > 0 and not callable(converters[0]):
+        converters = compile_row_converter(type_conversion_object_list)
+    return [convert(entry) for (convert, entry) in zip(converters, row)]
+
+def convert_rows(rows, type_conversion_object_list):
+    '''
+    Convert a list of rows to the appropriate types given by the corresponding type_conversion_objects.
+    This gives the same result as calling convert_row on each row, but is much faster for a table of
+    any size: the rows are transposed to columns, and each column is converted by convert_column,
+    which converts a column in one step where it can.  Prefer this to calling convert_row in a loop.
+    Parameters:
+       rows -- the rows to be converted
+       type_conversion_object_list -- a list (length of each row) of type_conversion_objects to guide the conversion
+    Returns:
+       the converted rows, as lists
+    '''
+    if len(rows) == 0:
+        return []
+    columns = list(zip(*rows))
+    converted = [convert_column(list(column), type_conversion_object) for (column, type_conversion_object) in zip(columns, type_conversion_object_list)]
+    return [list(row) for row in zip(*converted)]
 
 def convert_column(column, type_conversion_object):
     '''
     Convert a column (as a list) of a DataPlaneTable to the appropriate types given by the corrsponding 
+    For a DATA_PLANE_STRING column, the type_conversion_object may also have a member categorical;
+    if it is True, the column is returned as a pandas.Categorical (integer codes into a table of
+    the distinct strings) rather than a list.  This is far more compact for a column with few
+    distinct values.
+    To put the converted column into pandas or numpy, use convert_column_to_array, which
+    doesn't build the list.
     Parameters:
         column -- the column to be converted
         type_conversion_object: a conversion object as described above
@@ -299,13 +496,27 @@ def convert_column(column, type_conversion_object):
         the column converted into the appropriate type
         
     '''
-    format_string = _get_safe(type_conversion_object, "format_string")
-    default_value = _get_safe(type_conversion_object, "default_value")
+    result = convert_column_to_array(column, type_conversion_object)
+    return result.tolist() if isinstance(result, np.ndarray) else result
+
+def convert_column_to_array(column, type_conversion_object):
+    '''
+    Convert a column of a DataPlaneTable to the appropriate types, as convert_column does, but return
+    the column as a numpy array: float64 for DATA_PLANE_NUMBER, bool for DATA_PLANE_BOOLEAN, and object
+    (holding strings, or datetime.date, datetime.datetime, or datetime.time objects) for the other types.
+    If the type_conversion_object asks for a categorical column, a pandas.Categorical is returned.
+    Parameters:
+        column -- the column to be converted
+        type_conversion_object: a conversion object as described in convert_element
+    Returns:
+        the column converted into the appropriate type, as an array
+    '''
+    format_string = type_conversion_object.get("format_string")
+    default_value = type_conversion_object.get("default_value")
     data_plane_type = type_conversion_object["type"]
     # Make sure the default_value is the appropriate t ype
     default_value = _convert_default_value(data_plane_type, format_string, default_value)
-    return _coerce_types_in_series(column, data_plane_type, format_string,  default_value)
-    
-
-    
-
+    result = _coerce_types_in_series(column, data_plane_type, format_string,  default_value)
+    if data_plane_type == DATA_PLANE_STRING and type_conversion_object.get("categorical"):
+        return pd.Categorical(result)
+    return result
@@ -31,15 +31,27 @@ the tables automatically using the instantiated DataPlaneTable.
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from functools import reduce
-from math import nan, isnan
+import io
+from operator import itemgetter
+import json
+import os
 import re
+import urllib.error
+import urllib.parse
+import urllib.request
+import numpy as np
 import pandas as pd
 
 import datetime
 
+from dataplane.conversion_utils import ISOFORMAT_PARSERS, convert_column_to_array
 from dataplane.data_plane_utils import DATA_PLANE_BOOLEAN, DATA_PLANE_NUMBER, DATA_PLANE_DATETIME, DATA_PLANE_DATE, DATA_PLANE_SCHEMA_TYPES, DATA_PLANE_STRING, DATA_PLANE_TIME_OF_DAY, InvalidDataException
 
+# True iff pandas always copies on write (pandas 3 and later).  DataFrameTable only shares
+# float columns with the dataframe it's built from under copy-on-write; otherwise a later
+# change to that dataframe would change the table, so the columns are copied
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
 DATA_PLANE_FILTER_FIELDS = {
     'ALL': {'arguments'},
     'ANY': {'arguments'},
@@ -51,6 +63,104 @@ DATA_PLANE_FILTER_FIELDS = {
 
 DATA_PLANE_FILTER_OPERATORS = set(DATA_PLANE_FILTER_FIELDS.keys())
 
+# The operators, in the order they're listed in error messages, and the required fields for
+# each operator as a tuple, for check_valid_spec
+_VALID_OPERATOR_LIST = ['ALL', 'ANY', 'NONE', 'IN_LIST', 'IN_RANGE', 'REGEX_MATCH']
+_VALID_OPERATORS = frozenset(DATA_PLANE_FILTER_FIELDS)
+# The operators which take a list of filters as arguments
+_COMPOUND_OPERATORS = frozenset({'ALL', 'ANY', 'NONE'})
+_REQUIRED_FILTER_FIELDS = {operator: tuple(fields) for (operator, fields) in DATA_PLANE_FILTER_FIELDS.items()}
+
+
+def _convert_value_to_string(value):
+    # Internal use.  The DATA_PLANE_STRING case of _convert_to_type
+    if isinstance(value, str):
+        return value
+    try:
+        return str(value)
+    except ValueError:
+        raise InvalidDataException('Cannot convert value to string')
+
+def _convert_value_to_number(value):
+    # Internal use.  The DATA_PLANE_NUMBER case of _convert_to_type
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    
+    # try an automated conversion to float.  If it fails, it still
+    # might be an int in base 2, 8, or 16, so pass the error to try
+    # all of those
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    # if we get here, it must be a string or won't convert
+    if not isinstance(value, str):
+        raise InvalidDataException(f'Cannot convert {value} to number')
+    
+    # Try to convert to binary, octal, decimal
+    
+    for base in [2, 8, 16]:
+        try:
+            return int(value, base)
+        except ValueError:
+            pass
+    #Everything has failed, so toss the exception
+    raise InvalidDataException(f'Cannot convert {value} to number')
+
+def _convert_value_to_boolean(value):
+    # Internal use.  The DATA_PLANE_BOOLEAN case of _convert_to_type
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value in {'True', 'true', 't', '1'}
+    if isinstance(value, int):
+        return value == 1
+    return False
+
+def _convert_value_to_datetime(value):
+    # Internal use.  The DATA_PLANE_DATETIME case of _convert_to_type
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except Exception:
+            raise InvalidDataException(f"Can't convert {value} to datetime")
+
+def _convert_value_to_date(value):
+    # Internal use.  The DATA_PLANE_DATE case of _convert_to_type
+    # a datetime is also a date, but isn't a valid value for a date column
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value)
+        except Exception:
+            raise InvalidDataException(f"Can't convert {value} to date")
+
+def _convert_value_to_time(value):
+    # Internal use.  The DATA_PLANE_TIME_OF_DAY case of _convert_to_type
+    if isinstance(value, datetime.time):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.time.fromisoformat(value)
+        except Exception:
+            raise InvalidDataException(f"Can't convert {value} to time")
+ 
+    raise InvalidDataException(f"Couldn't convert {value} to {DATA_PLANE_TIME_OF_DAY}")
+
+# The converter _convert_to_type uses for each data plane type.  Any other type is
+# treated as DATA_PLANE_TIME_OF_DAY
+_VALUE_CONVERTERS = {
+    DATA_PLANE_STRING: _convert_value_to_string,
+    DATA_PLANE_NUMBER: _convert_value_to_number,
+    DATA_PLANE_BOOLEAN: _convert_value_to_boolean,
+    DATA_PLANE_DATETIME: _convert_value_to_datetime,
+    DATA_PLANE_DATE: _convert_value_to_date,
+    DATA_PLANE_TIME_OF_DAY: _convert_value_to_time
+}
 
 def _convert_to_type(data_plane_type, value):
     '''
@@ -66,76 +176,7 @@ def _convert_to_type(data_plane_type, value):
     Returns:
         value cast to the correct type
     '''
-    if data_plane_type == DATA_PLANE_STRING:
-        if isinstance(value, str):
-            return value
-        try:
-            return str(value)
-        except ValueError:
-            raise InvalidDataException('Cannot convert value to string')
-    elif data_plane_type == DATA_PLANE_NUMBER:
-        if isinstance(value, int) or isinstance(value, float):
-            return value
-        
-        # try an automated conversion to float.  If it fails, it still
-        # might be an int in base 2, 8, or 16, so pass the error to try
-        # all of those
-
-        try:
-            return float(value)
-        except ValueError:
-            pass
-        # if we get here, it must be a string or won't convert
-        if not isinstance(value, str):
-            raise InvalidDataException(f'Cannot convert {value} to number')
-        
-        # Try to convert to binary, octal, decimal
-        
-        for base in [2, 8, 16]:
-            try:
-                return int(value, base)
-            except ValueError:
-                pass
-        #Everything has failed, so toss the exception
-        raise InvalidDataException(f'Cannot convert {value} to number')
-    
-    elif data_plane_type == DATA_PLANE_BOOLEAN:
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value in {'True', 'true', 't', '1'}
-        if isinstance(value, int):
-            return value == 1
-        return False
-    # Everything else is a date or time
-
-    elif data_plane_type == DATA_PLANE_DATETIME:
-        if type(value) == type(datetime.datetime.now()):
-            return value
-        if isinstance(value, str):
-            try:
-                return datetime.datetime.fromisoformat(value)
-            except Exception:
-                raise InvalidDataException(f"Can't convert {value} to datetime")
-        
-    elif data_plane_type == DATA_PLANE_DATE:
-        if type(value) == type(datetime.datetime.now().date()):
-            return value
-        if isinstance(value, str):
-            try:
-                return datetime.date.fromisoformat(value)
-            except Exception:
-                raise InvalidDataException(f"Can't convert {value} to date")
-    else: # data_plane_type = DATA_PLANE_TIME_OF_DAT
-        if type(value) == type(datetime.datetime.now().time()):
-            return value
-        if isinstance(value, str):
-            try:
-                return datetime.time.fromisoformat(value)
-            except Exception:
-                raise InvalidDataException(f"Can't convert {value} to time")
-     
-        raise InvalidDataException(f"Couldn't convert {value} to {data_plane_type}")
+    return _VALUE_CONVERTERS.get(data_plane_type, _convert_value_to_time)(value)
 
 
 def _convert_list_to_type(data_plane_type, value_list):
@@ -151,7 +192,17 @@ def _convert_list_to_type(data_plane_type, value_list):
     Returns:
         value_list with each element cast to the correct type
     '''
-    return [_convert_to_type(data_plane_type, elem) for elem in value_list]
+    # Date and time lists usually arrive as isoformat strings; parse them in one map() over the
+    # list.  If any entry isn't a string, or doesn't parse, fall through to the converter, which
+    # handles the other cases and raises the appropriate exception
+    if data_plane_type in ISOFORMAT_PARSERS:
+        try:
+            return list(map(ISOFORMAT_PARSERS[data_plane_type], value_list))
+        except (TypeError, ValueError):
+            pass
+    # Look up the converter once for the whole list
+    converter = _VALUE_CONVERTERS.get(data_plane_type, _convert_value_to_time)
+    return [converter(elem) for elem in value_list]
 
 def _convert_to_output_string(data_plane_type, value):
     '''
@@ -197,6 +248,17 @@ def check_valid_spec(filter_spec):
     Arguments:
         filter_spec: spec to test for validity
     '''
+    # Walk the tree with an explicit stack rather than recursion, so deep trees can't
+    # exhaust the recursion limit.  The arguments are pushed in reverse so they are checked
+    # in order, and the first error reported is the same as for a depth-first recursive walk
+    stack = [filter_spec]
+    while len(stack) > 0:
+        stack.extend(reversed(_check_valid_node(stack.pop())))
+
+def _check_valid_node(filter_spec):
+    # Internal use by check_valid_spec.  Check a single node of a filter spec, throwing an
+    # InvalidDataException if it's invalid.  Returns the arguments of the node for ALL, ANY,
+    # and NONE (which check_valid_spec then checks), and [] for the primitive operators
 
     # Check to make sure filter_spec is a dictionary, and not something else
     if not isinstance(filter_spec, dict):
@@ -205,11 +267,10 @@ def check_valid_spec(filter_spec):
     # Step 1: check to make sure there is an operator field, and that it's an operator we recognize
     if 'operator' in filter_spec:
         operator = filter_spec['operator']
-        valid_operators = ['ALL', 'ANY', 'NONE', 'IN_LIST', 'IN_RANGE', 'REGEX_MATCH']
-        if not type(operator) == str:
+        if type(operator) is not str:
             raise InvalidDataException(f'operator {operator} is not a string')
-        if not operator in valid_operators:
-            msg = f'{operator} is not a valid operator.  Valid operators are {valid_operators}'
+        if not operator in _VALID_OPERATORS:
+            msg = f'{operator} is not a valid operator.  Valid operators are {_VALID_OPERATOR_LIST}'
             raise InvalidDataException(msg)
     else:
         raise InvalidDataException(f'There is no operator in {filter_spec}')
@@ -218,19 +279,16 @@ def check_valid_spec(filter_spec):
     # going to use keys() to get the fields in the spec, and this will include the
     # operator, 'operator' is one of the fields
     
-    fields_in_spec = set(filter_spec.keys())
-    missing_fields = DATA_PLANE_FILTER_FIELDS[operator] - fields_in_spec
+    missing_fields = [field for field in _REQUIRED_FILTER_FIELDS[operator] if field not in filter_spec]
     if len(missing_fields) > 0:
         raise InvalidDataException(f'{filter_spec} is missing required fields {_canonize_set(missing_fields)}')
-    # For ALL and ANY, recursively check the arguments list and return
-    if (operator in {'ALL', 'ANY', 'NONE'}):
+    # For ALL and ANY, return the arguments list for check_valid_spec to check
+    if (operator in _COMPOUND_OPERATORS):
         if not isinstance(filter_spec['arguments'], list):
             bad_type = type(filter_spec["arguments"])
             msg = f'The arguments field for {operator} must be a list, not {bad_type}'
             raise InvalidDataException(msg)
-        for arg in filter_spec['arguments']:
-            check_valid_spec(arg)
-        return
+        return filter_spec['arguments']
     # if we get here, it's IN_LIST, IN_RANGE, or REGEX_MATCH.  
     
     # For IN_LIST, check that the values argument is a list
@@ -269,16 +327,64 @@ def check_valid_spec(filter_spec):
         except TypeError:
             msg = f'max_val {filter_spec["max_val"]} and min_val {filter_spec["min_val"]} must be comparable for an IN_RANGE filter'
             raise InvalidDataException(msg)
+    return []
                
 
 def _valid_column_spec(column):
     # True iff column is a dictionary with keys "name", "type"
-    if type(column) == dict:
+    if type(column) is dict:
         keys = column.keys()
         return 'name' in keys and 'type' in keys
     return False
     
 
+# A rough relative cost of evaluating each primitive filter over a column, used to order the
+# arguments of ALL, ANY, and NONE.  The cost of a compound filter is the sum of its arguments'
+_FILTER_COSTS = {'IN_RANGE': 1, 'IN_LIST': 2, 'REGEX_MATCH': 8}
+
+# REGEX_MATCH filters over columns with at least this many rows match each distinct value
+# once, rather than every row; below this, finding the distinct values costs more than it saves
+_REGEX_DISTINCT_MIN_ROWS = 1024
+
+# When fewer than this fraction of the rows are still undecided in an ALL, ANY, or NONE, the
+# remaining arguments are evaluated over just the undecided rows rather than the whole table
+_SUBSET_EVALUATION_FRACTION = 0.25
+
+def _constant_value(operator, arguments):
+    # Internal use.  The result of an ALL, ANY, or NONE over arguments if it's the same for every
+    # row: True or False, found from the arguments' own constant values.  ALL of no arguments is
+    # True, and ANY of no arguments is False.  Returns None if the result depends on the row
+    constants = [argument.constant for argument in arguments]
+    if operator == 'ALL':
+        if False in constants: return False
+        return True if all(constant is True for constant in constants) else None
+    if True in constants:
+        any_value = True
+    elif all(constant is False for constant in constants):
+        any_value = False
+    else:
+        return None
+    return any_value if operator == 'ANY' else not any_value
+
+def _filter_array(values, data_plane_type):
+    # Internal use.  Convert a column of values to the numpy array used by
+    # DataPlaneFilter.filter_mask.  A numeric column whose values are all numbers
+    # becomes a float64 array; every other column becomes an object array holding
+    # the values as they are
+    # Arguments:
+    #     values: the column, as a list or numpy array
+    #     data_plane_type: the type of the column
+    # Returns:
+    #     The column as a numpy array
+    if data_plane_type == DATA_PLANE_NUMBER:
+        array = np.asarray(values) if len(values) > 0 else np.zeros(0)
+        if array.dtype.kind in 'iuf':
+            return array.astype(float, copy = False)
+    result = np.empty(len(values), dtype = object)
+    result[:] = values
+    return result
+
+
 class DataPlaneFilter:
     '''
     A Class which implements a Filter used  to filter rows.
@@ -292,15 +398,45 @@ class DataPlaneFilter:
         filter_spec: a Specification of the filter as a dictionary.
         columns: the columns in the form of a list {"name", "type"}
     '''
+    # A filter tree has one DataPlaneFilter per node, so the instances don't carry a __dict__.
+    # A filter isn't changed once it's built, so tables can share it (see _make_filter)
+    __slots__ = (
+        'operator', 'arguments', 'cost', 'evaluation_order', 'column_index', 'column_name', 'column_type',
+        'value_list', 'value_set', 'sorted_values', 'max_val', 'min_val', 'regex', 'expression', 'literal',
+        'constant'
+    )
+
     def __init__(self, filter_spec, columns):
         check_valid_spec(filter_spec)
         bad_columns = [column for column in columns if not _valid_column_spec(column)]
         if len(bad_columns) > 0:
             raise InvalidDataException(f'Invalid column specifications {bad_columns}')
+        self._build(filter_spec, columns)
+
+    @classmethod
+    def _from_validated(cls, filter_spec, columns):
+        # Internal use.  Create a DataPlaneFilter from a filter_spec and columns which have
+        # already been checked.  This is used for the arguments of ALL, ANY, and NONE: the
+        # constructor checks the whole tree once, so the subtrees aren't checked again
+        result = cls.__new__(cls)
+        result._build(filter_spec, columns)
+        return result
+
+    def _build(self, filter_spec, columns):
+        # Internal use.  Set up the filter from filter_spec, which has been checked by
+        # check_valid_spec, over columns, which have been checked by _valid_column_spec
         self.operator = filter_spec["operator"]
-        if (self.operator == 'ALL' or self.operator == 'ANY' or self.operator == 'NONE'):
-            self.arguments = [DataPlaneFilter(argument, columns) for argument in filter_spec["arguments"]]
+        if (self.operator in _COMPOUND_OPERATORS):
+            self.arguments = [DataPlaneFilter._from_validated(argument, columns) for argument in filter_spec["arguments"]]
+            # filter_mask evaluates the arguments cheapest first, so that the short-circuit
+            # in ALL, ANY, and NONE skips the expensive ones.  self.arguments keeps the
+            # original order for to_filter_spec
+            self.constant = _constant_value(self.operator, self.arguments)
+            self.cost = 0 if self.constant is not None else sum(argument.cost for argument in self.arguments)
+            self.evaluation_order = sorted(self.arguments, key = lambda argument: argument.cost)
         else:
+            self.constant = None
+            self.cost = _FILTER_COSTS[self.operator]
             column_names = [column["name"] for column in columns]
             column_types = [column["type"] for column in columns]
             try:
@@ -311,7 +447,18 @@ class DataPlaneFilter:
                 raise InvalidDataException(f'{filter_spec["column"]} is not a valid column name')
             
             if self.operator == 'IN_LIST':
-                self.value_list = _convert_list_to_type(self.column_type, filter_spec['values'])
+                # value_list is kept (as a tuple, since it's never changed) for to_filter_spec;
+                # membership tests use value_set
+                self.value_list = tuple(_convert_list_to_type(self.column_type, filter_spec['values']))
+                self.value_set = frozenset(self.value_list)
+                if len(self.value_set) == 0:
+                    # No row can be in an empty list
+                    self.constant = False
+                    self.cost = 0
+                # For numeric columns, keep the values sorted in an array, so membership can be tested
+                # over a whole column by binary search (see filter_mask)
+                if self.column_type == DATA_PLANE_NUMBER:
+                    self.sorted_values = np.unique(np.array(self.value_list, dtype = float))
             elif self.operator == 'IN_RANGE': # operator is IN_RANGE
                 max_val = _convert_to_type(self.column_type, filter_spec['max_val'])
                 min_val = _convert_to_type(self.column_type, filter_spec['min_val'])
@@ -324,6 +471,9 @@ class DataPlaneFilter:
                 self.regex = re.compile(filter_spec['expression'])
                 # hang on to the original expression for later jsonification
                 self.expression = filter_spec['expression']
+                # An expression with no special characters only matches itself, and is tested
+                # by comparing the column to it rather than by the regex engine
+                self.literal = self.expression if re.escape(self.expression) == self.expression else None
 
     def to_filter_spec(self):
         '''
@@ -333,9 +483,8 @@ class DataPlaneFilter:
         Returns:
             A dictionary form of the Filter
         '''
-        compound_operators = {'ALL', 'ANY', 'NONE'}
         result = {"operator": self.operator}
-        if self.operator in compound_operators:
+        if self.operator in _COMPOUND_OPERATORS:
             result["arguments"] = [argument.to_filter_spec() for argument in self.arguments]
         else:
             try:
@@ -359,14 +508,17 @@ class DataPlaneFilter:
         Returns the rows for which the filter returns True.
 
         Arguments:
-            rows: list of list of values, in the same order as the columns
+            rows: list of list of values, in the same order as the columns, or a 2-D numpy array
         Returns:
-            subset of the rows, which pass the filter
+            subset of the rows, which pass the filter (a 2-D numpy array if rows is)
         '''
-        # Just an overlay on filter_index, which returns the INDICES of the rows
-        # which pass the filter.  This is the top-level call, filter_index is recursive
-        indices = self.filter_index(rows)
-        return [rows[i] for i in range(len(rows)) if i in indices]
+        # Just an overlay on filter_mask, which returns a boolean array with True for the
+        # rows which pass the filter.  This is the top-level call, filter_mask is recursive
+        mask = self.filter_mask(self._row_columns(rows), len(rows))
+        if isinstance(rows, np.ndarray):
+            # rows is a 2-D array, so the rows can be selected in one step
+            return rows[mask]
+        return [rows[i] for i in np.flatnonzero(mask).tolist()]
 
     def filter_index(self, rows):
         '''
@@ -381,25 +533,108 @@ class DataPlaneFilter:
             INDICES of the rows which pass the filter, AS A SET
  
         '''
-        all_indices = range(len(rows))
+        mask = self.filter_mask(self._row_columns(rows), len(rows))
+        return set(np.flatnonzero(mask).tolist())
+
+    def filter_mask(self, columns, num_rows):
+        '''
+        Not designed for external call.
+        Evaluate the filter over the columns of a table.  Each primitive filter is a single
+        vectorized operation over its column, and ALL, ANY, and NONE combine the masks of
+        their arguments.
+        Arguments:
+            columns: the columns of the table, indexed by column index (a list, or a dictionary
+                with an entry for each column the filter uses).  Each column is a numpy array from
+                _filter_array
+            num_rows: the number of rows in the table
+
+        Returns:
+            A numpy boolean array of length num_rows, True for the rows which pass the filter
+        '''
+        if self.constant is not None:
+            # The filter passes every row or no row, whatever the table holds (see _constant_value)
+            return np.full(num_rows, self.constant, dtype = bool)
         if self.operator == 'ALL':
-            argument_indices = [argument.filter_index(rows) for argument in self.arguments]
-            return reduce(lambda x, y: x & y, argument_indices, set(all_indices))
-        elif self.operator == 'ANY':
-            argument_indices = [argument.filter_index(rows) for argument in self.arguments]
-            return reduce(lambda x, y: x | y, argument_indices, set())
-        elif self.operator == 'NONE':
-            argument_indices = [argument.filter_index(rows) for argument in self.arguments]
-            return reduce(lambda x, y: x - y, argument_indices, set(all_indices))
+            # AND the argument masks into a single mask, in place.  Only the rows which
+            # still pass are undecided, and once there are none there's no need to
+            # evaluate the remaining arguments
+            result = np.ones(num_rows, dtype = bool)
+            for argument in self.evaluation_order:
+                if not self._combine_argument_mask(argument, columns, result, True): break
+            return result
+        if self.operator in {'ANY', 'NONE'}:
+            # OR the argument masks into a single mask, in place.  Only the rows which don't
+            # pass yet are undecided, and once every row passes there's no need to evaluate
+            # the remaining arguments.  NONE is the complement of ANY
+            result = np.zeros(num_rows, dtype = bool)
+            for argument in self.evaluation_order:
+                if not self._combine_argument_mask(argument, columns, result, False): break
+            return result if self.operator == 'ANY' else np.logical_not(result, out = result)
         # Primitive operator if we get here.  Dig out the values to filter
-        values = [row[self.column_index] for row in rows]
+        values = columns[self.column_index]
         if self.operator == 'IN_LIST':
-            return set([i for i in all_indices if values[i] in self.value_list])
+            if values.dtype.kind == 'f':
+                if len(self.sorted_values) == 0:
+                    return np.zeros(num_rows, dtype = bool)
+                positions = np.searchsorted(self.sorted_values, values)
+                np.minimum(positions, len(self.sorted_values) - 1, out = positions)
+                return self.sorted_values[positions] == values
+            return np.fromiter(map(self.value_set.__contains__, values), dtype = bool, count = num_rows)
         elif self.operator == 'IN_RANGE':
-            return set([i for i in all_indices if values[i] <= self.max_val and values[i] >= self.min_val])
+            if values.dtype.kind == 'f':
+                result = values >= self.min_val
+                return np.logical_and(result, values <= self.max_val, out = result)
+            return np.asarray((values <= self.max_val) & (values >= self.min_val), dtype = bool)
         else: # self.operator == 'REGEX_MATCH'
-            return set([i for i in all_indices if self.regex.fullmatch(values[i]) is not None])
-        
+            if self.literal is not None:
+                return np.asarray(values == self.literal, dtype = bool)
+            # bind the match method once, rather than looking it up for every value
+            fullmatch = self.regex.fullmatch
+            if num_rows < _REGEX_DISTINCT_MIN_ROWS:
+                return np.fromiter((fullmatch(value) is not None for value in values), dtype = bool, count = num_rows)
+            # String columns typically repeat values, so match each distinct value once
+            # and then map the results back to the rows
+            codes, distinct_values = pd.factorize(values, use_na_sentinel = False)
+            matches = np.fromiter((fullmatch(value) is not None for value in distinct_values), dtype = bool, count = len(distinct_values))
+            return matches[codes]
+
+    def _combine_argument_mask(self, argument, columns, result, undecided_value):
+        # Internal use by filter_mask.  Combine the mask of argument into result, in place:
+        # rows of result which are undecided_value (True for ALL, False for ANY and NONE) take
+        # the value of argument's mask.  If few rows are undecided, argument is evaluated over
+        # just those rows, so later (and more expensive) arguments of a selective filter look at
+        # a fraction of the table.  Returns False if no row was undecided, and so argument (and
+        # any argument after it) can't change result
+        passing = np.count_nonzero(result)
+        num_undecided = passing if undecided_value else len(result) - passing
+        if num_undecided == 0:
+            return False
+        if num_undecided >= len(result) * _SUBSET_EVALUATION_FRACTION:
+            combine = np.logical_and if undecided_value else np.logical_or
+            combine(result, argument.filter_mask(columns, len(result)), out = result)
+        else:
+            undecided = np.flatnonzero(result if undecided_value else ~result)
+            subset = {index: columns[index][undecided] for index in argument._used_column_types()}
+            result[undecided] = argument.filter_mask(subset, num_undecided)
+        return True
+
+    def _used_column_types(self):
+        # Internal use.  Return a dictionary {column_index: column_type} of the columns
+        # this filter (and its arguments) refer to
+        if self.operator in _COMPOUND_OPERATORS:
+            result = {}
+            for argument in self.arguments:
+                result.update(argument._used_column_types())
+            return result
+        return {self.column_index: self.column_type}
+
+    def _row_columns(self, rows):
+        # Internal use.  Return the columns of rows which this filter uses, as a dictionary
+        # {column_index: array} suitable for filter_mask
+        return {
+            index: _filter_array([row[index] for row in rows], column_type)
+            for (index, column_type) in self._used_column_types().items()
+        }
 
     def get_all_column_values_in_filter(self, column_name):
         '''
@@ -413,9 +648,9 @@ class DataPlaneFilter:
         '''
         if column_name is None:
             return set()
-        if type(column_name) != str:
+        if type(column_name) is not str:
             return set()
-        if self.operator in ['ALL', 'ANY', 'NONE']:
+        if self.operator in _COMPOUND_OPERATORS:
             values = set()
             # I'd like to use a comprehension here, but I'm not sure how it interacts with union
             for argument in self.arguments:
@@ -424,21 +659,113 @@ class DataPlaneFilter:
         if column_name != self.column_name:
             return set()
         if self.operator == 'IN_LIST':
-            return set(self.value_list)
+            return set(self.value_set)
         if self.operator == 'IN_RANGE':
             return {self.max_val, self.min_val} 
         # must be REGEX_MATCH
         return {self.expression}
         
-def _select_entries_from_row(row, indices):
-    # Pick the entries of row trhat are in indices, maintaining the order of the 
-    # indices.  This is to support the column-choice operation in DataPlaneTable.get_filtered_rows
+
+# Tables build their filters through _make_filter, which keeps the most recent
+# _FILTER_CACHE_SIZE filters, keyed by _filter_cache_key.  A server often sees the same filter
+# many times (paging through the results, for example), and building a filter checks the spec,
+# converts the values, and compiles the regular expressions.  A DataPlaneFilter isn't changed
+# once it's built, so one instance can be shared by every request which uses it
+_FILTER_CACHE_SIZE = 256
+_filter_cache = {}
+
+def _filter_cache_key(filter_spec, columns):
+    # Internal use by _make_filter.  A hashable form of (filter_spec, columns), or None if
+    # filter_spec can't be written as JSON or columns are invalid
+    if not all(_valid_column_spec(column) for column in columns):
+        return None
+    try:
+        spec_key = json.dumps(filter_spec, sort_keys = True)
+    except (TypeError, ValueError):
+        return None
+    return (spec_key, tuple((column["name"], column["type"]) for column in columns))
+
+def _make_filter(filter_spec, columns):
+    # Internal use.  Return DataPlaneFilter(filter_spec, columns), from _filter_cache if it's there.
+    # Invalid specs raise InvalidDataException as in the constructor, and are never cached
+    key = _filter_cache_key(filter_spec, columns)
+    if key is not None and key in _filter_cache:
+        return _filter_cache[key]
+    result = DataPlaneFilter(filter_spec, columns)
+    if key is not None:
+        if len(_filter_cache) >= _FILTER_CACHE_SIZE:
+            # dictionaries keep insertion order, so this drops the oldest filter.  Another request
+            # may have dropped it already, so pop rather than del
+            _filter_cache.pop(next(iter(_filter_cache), None), None)
+        _filter_cache[key] = result
+    return result
+
+def _page(sequence, offset, limit):
+    # Return the part of sequence (a list or numpy array) which starts at offset and is at most
+    # limit long, or all of it from offset if limit is None.  This is to support the offset and
+    # limit arguments of get_filtered_rows.  sequence itself is returned if there's nothing to cut
+    if offset == 0 and limit is None:
+        return sequence
+    return sequence[offset:] if limit is None else sequence[offset:offset + limit]
+
+def _entry_selector(indices):
+    # Return a function which picks the entries of a row that are in indices, maintaining the
+    # order of the indices.  This is to support the column-choice operation in
+    # DataPlaneTable.get_filtered_rows; the selector is built once and applied to every row
     # Arguments:
-    #     row: the tow of vaslues
     #     indices: the indices to pick
     # Returns:
-    #     The subset of the row corresponding to the indices
-    return [row[i] for i in range(len(row)) if i in indices]
+    #     A function from a row to the list of the entries of the row at indices
+    if len(indices) == 0:
+        return lambda row: []
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: [row[index]]
+    getter = itemgetter(*indices)
+    return lambda row: list(getter(row))
+
+
+def _sorted_unique_values(values, data_plane_type):
+    # Return the distinct values of a column, converted to data_plane_type and sorted.
+    # This is to support all_values for tables which hold their data by column.  The
+    # distinct values are found with pandas' hash table rather than a Python set, and
+    # float columns are sorted by numpy
+    # Arguments:
+    #     values: the column, as a pandas Series or numpy array
+    #     data_plane_type: the type of the column
+    # Returns:
+    #     The sorted list of distinct values
+    unique_values = pd.unique(values)
+    if unique_values.dtype.kind == 'f':
+        return np.sort(unique_values).tolist()
+    result = _convert_list_to_type(data_plane_type, unique_values.tolist())
+    result.sort()
+    return result
+
+def _column_range(values, data_plane_type):
+    # Return the dictionary {max_val, min_val} of a column, converted to data_plane_type.
+    # This is to support range_spec: it's one pass over the column, rather than finding and
+    # sorting the distinct values.  A column which isn't a float array is converted to
+    # data_plane_type first, so the values are compared as all_values sorts them.  Nones and
+    # NaNs in a number column are ignored
+    # Arguments:
+    #     values: the column, as a numpy array
+    #     data_plane_type: the type of the column
+    # Returns:
+    #     {"max_val": the maximum of the column, "min_val": the minimum of the column}, or
+    #     {"max_val": None, "min_val": None} if the column has no values (or only NaNs)
+    if values.dtype.kind == 'f':
+        if np.isnan(values).all():
+            return {"max_val": None, "min_val": None}
+        return {"max_val": np.nanmax(values).item(), "min_val": np.nanmin(values).item()}
+    if data_plane_type == DATA_PLANE_NUMBER:
+        converted = _convert_list_to_type(data_plane_type, [value for value in values.tolist() if value is not None])
+        converted = [value for value in converted if value == value]
+    else:
+        converted = _convert_list_to_type(data_plane_type, values.tolist())
+    if len(converted) == 0:
+        return {"max_val": None, "min_val": None}
+    return {"max_val": max(converted), "min_val": min(converted)}
 
 
 DEFAULT_HEADER_VARIABLES = {"required": [], "optional": []}
@@ -465,9 +792,45 @@ class DataPlaneTable:
     def __init__(self, schema, get_rows, header_variables=None):
         self.is_dataplane_table = True
         self.schema = schema
+        self._schema_by_name = None
+        self._column_name_set = None
+        self._column_indices = None
         self.get_rows = get_rows
         self.header_variables = DEFAULT_HEADER_VARIABLES if header_variables is None else header_variables
 
+    @property
+    def schema_by_name(self):
+        '''
+        The schema as a dictionary {column_name: column_type}.  This is built on first use and
+        then kept, so looking up the type of a column doesn't scan the schema.  If a name is
+        repeated, the first column with that name wins, as it does for the column's index
+        '''
+        if self._schema_by_name is None:
+            self._schema_by_name = {column["name"]: column["type"] for column in reversed(self.schema)}
+        return self._schema_by_name
+
+    @property
+    def column_name_set(self):
+        '''
+        The names of the columns as a frozenset, for checking that requested columns exist.
+        This is built on first use and then kept
+        '''
+        if self._column_name_set is None:
+            self._column_name_set = frozenset(self.column_names())
+        return self._column_name_set
+
+    def _column_index(self, column_name):
+        # Internal use.  Return the index of column_name in the schema, raising an
+        # InvalidDataException if it isn't a column of this table.  The dictionary
+        # {column_name: index} is built on first use
+        if self._column_indices is None:
+            # reversed, so that if a name is repeated the first column with that name wins
+            self._column_indices = {column["name"]: i for (i, column) in reversed(list(enumerate(self.schema)))}
+        try:
+            return self._column_indices[column_name]
+        except (KeyError, TypeError):
+            raise InvalidDataException(f'{column_name} is not a column of this table')
+
     # This is used to get the names of a column from the schema
 
     def column_names(self):
@@ -482,6 +845,17 @@ class DataPlaneTable:
         '''
         return [column["type"] for column in self.schema]
 
+    def get_columns(self):
+        '''
+        Return the table as a list of columns, one for each entry of the schema,
+        in schema order.  This transposes get_rows(); subclasses which hold their data
+        by column should override it
+        '''
+        rows = self.get_rows()
+        if len(rows) == 0:
+            return [[] for column in self.schema]
+        return [list(column) for column in zip(*rows)]
+
     def get_column_type(self, column_name):
         '''
         Returns the type of column column_name, or None if this table doesn't have a column with
@@ -490,11 +864,11 @@ class DataPlaneTable:
         Arguments:
             column_name: name of the column to get the type for
         '''
-        matches = [column["type"] for column in self.schema if column["name"] == column_name]
-        if len(matches) == 0:
+        try:
+            return self.schema_by_name.get(column_name)
+        except TypeError:
+            # column_name isn't hashable, so it can't be the name of a column
             return None
-        else:
-            return matches[0]
        
 
     def all_values(self, column_name:str):
@@ -508,15 +882,12 @@ class DataPlaneTable:
             List of the values
 
         '''
-        try:
-            index = self.column_names().index(column_name)
-        except ValueError as original_error:
-            raise InvalidDataException(f'{column_name} is not a column of this table') from original_error
+        index = self._column_index(column_name)
         data_plane_type = self.schema[index]["type"]
         rows = self.get_rows()
-        result =  _convert_list_to_type(data_plane_type, list(set([row[index] for row in rows])))
-        result.sort()
-        return result
+        column = np.empty(len(rows), dtype = object)
+        column[:] = [row[index] for row in rows]
+        return _sorted_unique_values(column, data_plane_type)
 
     def range_spec(self, column_name:str):
         '''
@@ -529,41 +900,73 @@ class DataPlaneTable:
             the minimum and  maximum of the column
 
         '''
-        entry = [column for column in self.schema if column["name"] == column_name]
-        if len(entry) == 0:
-            raise InvalidDataException(f'{column_name} is not a column of this table')
-        
-        values = self.all_values(column_name)
-       
-        return {"max_val": values[-1], "min_val": values[0]}
+        index = self._column_index(column_name)
+        return _column_range(self._column_array(index), self.schema[index]["type"])
+
+    def _column_array(self, index):
+        # Internal use.  The column at index as a numpy array, for range_spec.  Subclasses
+        # which hold their columns as arrays return those
+        rows = self.get_rows()
+        column = np.empty(len(rows), dtype = object)
+        column[:] = [row[index] for row in rows]
+        return column
     
     
             
 
-    def get_filtered_rows(self, filter_spec = None, columns = []):
+    def get_filtered_rows(self, filter_spec = None, columns = [], offset = 0, limit = None):
         '''
         Filter the rows according to the specification given by filter_spec.
         Returns the rows for which the resulting filter returns True.
 
         Arguments:
             filter_spec: Specification of the filter, as a dictionary
-            columns: the names of the columns to return.  Returns all columns if absent
+            columns: the names of the columns to return, in the order given.  Returns all columns if absent
+            offset: the number of passing rows to skip.  Defaults to 0
+            limit: the most rows to return, or None (the default) for all of them
         Returns:
             The subset of self.get_rows() which pass the filter
         '''
         # Note that we don't check if the column names are all valid
         if columns is None: columns = [] # Make sure there's a value
         if filter_spec is None:
-            rows = self.get_rows()
-        else:
-            made_filter = DataPlaneFilter(filter_spec, self.schema)
-            rows =  made_filter.filter(self.get_rows())
+            return self._select_columns(_page(self.get_rows(), offset, limit), columns)
+        made_filter = _make_filter(filter_spec, self.schema)
+        rows = self.get_rows()
+        mask = made_filter.filter_mask(made_filter._row_columns(rows), len(rows))
+        return self._gather_rows(rows, mask, columns, offset, limit)
+
+    def _select_columns(self, rows, columns):
+        # Internal use.  Return rows, keeping only the entries in columns (in the order given
+        # in columns).  If columns is empty, return rows unchanged
         if columns == []:
             return rows
         else:
-            names = self.column_names()
-            column_indices = [i for i in range(len(names)) if names[i] in columns]
-            return [_select_entries_from_row(row, column_indices) for row in rows]
+            column_indices = self._projection_indices(columns)
+            if isinstance(rows, np.ndarray):
+                # rows is a 2-D array, so the columns can be selected in one step
+                return rows[:, column_indices]
+            return list(map(_entry_selector(column_indices), rows))
+
+    def _gather_rows(self, rows, mask, columns, offset = 0, limit = None):
+        # Internal use.  Return the rows where mask is True, keeping only the entries in columns
+        # as _select_columns does, and only the page given by offset and limit (see _page).
+        # The entries are picked as each row is gathered, so no intermediate list of whole
+        # rows is built, and rows outside the page are never touched
+        if isinstance(rows, np.ndarray):
+            # rows is a 2-D array, so the rows and columns can be selected in one step each
+            return self._select_columns(_page(rows[mask], offset, limit), columns)
+        indices = _page(np.flatnonzero(mask), offset, limit).tolist()
+        if columns == []:
+            return [rows[i] for i in indices]
+        select = _entry_selector(self._projection_indices(columns))
+        return [select(rows[i]) for i in indices]
+
+    def _projection_indices(self, columns):
+        # Internal use.  The indices of the named columns, in the order given in columns.
+        # Names which aren't columns of this table, and repeats of a name, are skipped
+        names = self.column_name_set
+        return list(dict.fromkeys(self._column_index(name) for name in columns if name in names))
 
 
 
@@ -578,124 +981,402 @@ class RowTable(DataPlaneTable):
     def __init__(self, schema, rows):
         super(RowTable, self).__init__(schema, self._get_rows)
         self.rows = rows
+        self._data_version = 0
+        self.invalidate_cache()
+
+    @classmethod
+    def from_columns(cls, schema, columns):
+        '''
+        Create a RowTable from a list of columns rather than a list of rows.  This is
+        convenient for loaders which read and convert their data a column at a time.
+        Arguments:
+            schema: the schema of the table
+            columns: a list of columns, in schema order, each of which is a list of values
+        Returns:
+            A RowTable with the given schema whose rows are the columns zipped together
+        '''
+        return cls(schema, [list(row) for row in zip(*columns)])
     
     def _get_rows(self):
         '''
         Very simple: just return the rows
         '''
         return self.rows
-    
-def _convert_to_string(s):
-   return s if isinstance(s, str) else str(s) 
 
-def _convert_to_number(x, default_value = nan):
-    # Convert x to a number, or nan if there is no conversion
-    if (isinstance(x, int) or isinstance(x, float)):
-        return x
-    try:
-        return float(x)
-    except ValueError:
-        pass
-    try:
-        return int(x)
-    except ValueError:
-        return default_value
-
-def _convert_to_time(t, format_string = None, default_value = datetime.time(0, 0, 0)):
-    if isinstance(t, datetime.time):
-        return t
-    if isinstance(t, datetime.date):
-        return default_value
-    if isinstance(t, datetime.datetime):
-        return t.time()
-    if isinstance(t, str):
-        if format_string:
-            try:
-                return datetime.dateime.strptime(t, format_string).time()
-            except ValueError:
-                return default_value
-        try:
-            return datetime.time.fromisoformat(t)
-        except ValueError:
-            return default_value
-    return default_value
-
-def _convert_to_date(d, format_string = None, default_value = datetime.date(1900, 1, 1)):
-    if isinstance(d, datetime.date):
-        return d
-    if isinstance(d, datetime.time):
-        return default_value
-    if isinstance(d, datetime.datetime):
-        return d.date()
-    if isinstance(d, str):
-        if format_string:
-            try:
-                return datetime.datetime.strptime(d, format_string).date()
-            except ValueError:
-                return default_value
-        try:
-            return datetime.date.fromisoformat(d)
-        except ValueError:
-            return default_value
-    return default_value
-
-def _convert_to_datetime(dt,  format_string = None, default_value = datetime.datetime(1900, 1, 1, 0, 0, 0)):
-    if isinstance(dt, datetime.datetime):
-        return dt
-    if isinstance(dt, datetime.time):
-        return datetime.datetime(default_value.year, default_value.month, default_value.day, dt.hour, dt.minute, dt.second)
-    if isinstance(dt, datetime.date):
-        return datetime.datetime(dt.year, dt.month, dt.day, 0, 0, 0)
-    if isinstance(dt, str):
-        if format_string:
-            try:
-                return datetime.dateime.strptime(dt, format_string)
-            except ValueError:
-                return default_value
-        try:
-            return datetime.datetime.fromisoformat(dt)
-        except ValueError:
-            return default_value
-    return default_value
+    def invalidate_cache(self):
+        '''
+        Drop the columns, column arrays, distinct values, and ranges computed from the rows.  These are
+        rebuilt automatically if self.rows is replaced; call this after changing self.rows in place
+        '''
+        self._data_version += 1
+        self._cache_rows = None
+        self._columns = None
+        self._filter_columns = None
+        self._all_values = {}
+        self._range_specs = {}
 
-        
-    
+    def _check_cache(self):
+        # Internal use.  Drop everything computed from the rows if self.rows has been replaced
+        # since it was computed
+        if self._cache_rows is not self.rows:
+            self.invalidate_cache()
+            self._cache_rows = self.rows
 
-def _coerce_types(series, data_plane_type, column_default = None):
-    # Internal use, coercing a series (from a CSV or a dataframe) to the
-    # desired data plane type.
-    # ATM, no heroic conversion is being done -- eventually we will have to
-    # add a pretty significant ETL component
-    if data_plane_type == DATA_PLANE_STRING:
-        return [_convert_list_to_string(x) for x in series]
-    if data_plane_type == DATA_PLANE_NUMBER:
-        return [_convert_to_number(x) for x in series]
-    if data_plane_type == DATA_PLANE_BOOLEAN:
-        return [True if b else False for b in series]
-    if data_plane_type == DATA_PLANE_TIME_OF_DAY:
-        return [_convert_to_time(t) for t in series]
-    if data_plane_type == DATA_PLANE_DATE:
-        return [_convert_to_date(d) for d in series]
-    if data_plane_type == DATA_PLANE_DATETIME:
-        return [_convert_to_datetime(dt) for dt in series]
+    @property
+    def data_version(self):
+        '''
+        A number which changes whenever self.rows is replaced or invalidate_cache() is called, so
+        that anything derived from the rows (a cached response, say) can be checked against it
+        '''
+        self._check_cache()
+        return self._data_version
+
+    def get_columns(self):
+        '''
+        Return the table as a list of columns, in schema order.  The rows are transposed
+        once, and the columns are kept until the rows change
+        '''
+        self._check_cache()
+        if self._columns is None:
+            self._columns = super(RowTable, self).get_columns()
+        return self._columns
+
+    def _column_array(self, index):
+        # Internal use.  Overrides DataPlaneTable._column_array with the cached filter column
+        return self._get_filter_columns()[index]
+
+    def _get_filter_columns(self):
+        # Internal use.  The columns of self.rows as numpy arrays (see _filter_array), used
+        # to evaluate filters a column at a time.  These are built on first use, and rebuilt
+        # if self.rows is replaced
+        self._check_cache()
+        if self._filter_columns is None:
+            self._filter_columns = [
+                _filter_array(values, column["type"]) for (column, values) in zip(self.schema, self.get_columns())
+            ]
+        return self._filter_columns
+
+    def all_values(self, column_name:str):
+        '''
+        get all the values from column_name
+        Arguments:
+
+            column_name: name of the column to get the values for
+
+        Returns:
+            List of the values
+
+        '''
+        index = self._column_index(column_name)
+        self._check_cache()
+        if column_name not in self._all_values:
+            column = np.empty(len(self.rows), dtype = object)
+            column[:] = self.get_columns()[index]
+            self._all_values[column_name] = _sorted_unique_values(column, self.schema[index]["type"])
+        return list(self._all_values[column_name])
+
+    def range_spec(self, column_name:str):
+        '''
+        Get the dictionary {min_val, max_val} for column_name.  The range of each column
+        is kept until the rows change
+        Arguments:
+
+            column_name: name of the column to get the range spec for
+
+        Returns:
+            the minimum and  maximum of the column
+
+        '''
+        self._check_cache()
+        if column_name not in self._range_specs:
+            self._range_specs[column_name] = super(RowTable, self).range_spec(column_name)
+        return dict(self._range_specs[column_name])
+
+    def get_filtered_rows(self, filter_spec = None, columns = [], offset = 0, limit = None):
+        '''
+        Filter the rows according to the specification given by filter_spec.
+        Returns the rows for which the resulting filter returns True.  The filter is
+        evaluated over the columns of the table, and only the rows which pass are
+        looked up.
+
+        Arguments:
+            filter_spec: Specification of the filter, as a dictionary
+            columns: the names of the columns to return, in the order given.  Returns all columns if absent
+            offset: the number of passing rows to skip.  Defaults to 0
+            limit: the most rows to return, or None (the default) for all of them
+        Returns:
+            The subset of self.get_rows() which pass the filter
+        '''
+        if columns is None: columns = []
+        if filter_spec is None:
+            return self._select_columns(_page(self.rows, offset, limit), columns)
+        mask = _make_filter(filter_spec, self.schema).filter_mask(self._get_filter_columns(), len(self.rows))
+        return self._gather_rows(self.rows, mask, columns, offset, limit)
     
+# The compression of a downloaded CSV file, by the suffix of its url, when the response has no gzip
+# Content-Encoding.  pandas infers this from the url itself, but RemoteCSVTable parses the body of
+# its own request
+_CSV_COMPRESSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.zip': 'zip', '.xz': 'xz', '.zst': 'zstd'}
+
+def _is_http_url(url):
+    # Internal use by RemoteCSVTable.  True iff url is an http or https url
+    return urllib.parse.urlparse(url).scheme in ('http', 'https')
 
+def _file_validator(path):
+    # Internal use by RemoteCSVTable.  The (modification time, size) of the file at path, which
+    # changes when the file does, or None if path isn't a file
+    try:
+        status = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return (status.st_mtime_ns, status.st_size)
 
 class RemoteCSVTable(DataPlaneTable):
     '''
     A very common format for data interchange on the Internet is a downloadable
     CSV file.  It's so common it's worth making a class, just for this.  The
-    idea is that, when a get_rows request comes in, we download the table
-    into a dataframe and then return the list of rows, perhaps after doing
-    unit conversion
+    idea is that, when a request comes in, we download the table into a
+    dataframe and convert each column to the type given in the schema.  The
+    table is only downloaded on the first request; after that the converted
+    columns are held in a DataFrameTable, which serves the requests.
+    Call reset_dataframe() to check the file again on the next request; it's only
+    downloaded and converted again if it has changed.
+    Arguments:
+        schema: the schema of the table; the columns of the CSV file are matched
+           to the schema by position
+        url: the url (or path) of the CSV file
     '''
 
     def __init__(self, schema, url):
-        super(schema, self.get_rows)
+        super(RemoteCSVTable, self).__init__(schema, self._get_rows)
         self.url = url
         self.dataframe = None
+        self.table = None
+        # What identifies the version of the file which was loaded: the ETag and Last-Modified
+        # headers of an http(s) response, or the modification time and size of a file
+        self.validator = None
+        self.stale = False
+
+    def reset_dataframe(self):
+        '''
+        Mark the table as out of date, so that the next request checks the CSV file again.  The file
+        is only downloaded and converted again if it has changed: an http(s) url is fetched with a
+        conditional GET, using the ETag and Last-Modified headers of the last download, and a file is
+        compared by its modification time and size.  Other urls are always downloaded again
+        '''
+        self.stale = True
+
+    def _get_table(self):
+        # Internal use.  Download the CSV file, if it hasn't been or it has changed since the last
+        # reset_dataframe, and hold it as a DataFrameTable, which keeps the converted columns as
+        # arrays: filters run over the columns, and rows are only built for the rows and columns
+        # a request returns
+        if self.table is None or self.stale:
+            self.stale = False
+            dataframe = self._read_http() if _is_http_url(self.url) else self._read_file()
+            if dataframe is not None:
+                self._set_dataframe(dataframe)
+        return self.table
+
+    def _read_http(self):
+        # Internal use.  Fetch the CSV file at an http(s) url, returning the dataframe, or None if the
+        # server says the file hasn't changed since it was last fetched
+        headers = {}
+        if self.table is not None and self.validator is not None:
+            if 'ETag' in self.validator: headers['If-None-Match'] = self.validator['ETag']
+            if 'Last-Modified' in self.validator: headers['If-Modified-Since'] = self.validator['Last-Modified']
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.url, headers = headers)) as response:
+                body = response.read()
+                content_encoding = response.headers.get('Content-Encoding')
+                validator = {name: response.headers[name] for name in ('ETag', 'Last-Modified') if response.headers.get(name)}
+        except urllib.error.HTTPError as error:
+            if error.code == 304 and self.table is not None:
+                return None
+            raise
+        # A gzip Content-Encoding is decompressed, as pandas does when it fetches the url itself
+        if content_encoding == 'gzip':
+            compression = 'gzip'
+        else:
+            compression = _CSV_COMPRESSIONS.get(os.path.splitext(urllib.parse.urlparse(self.url).path)[1])
+        dataframe = pd.read_csv(io.BytesIO(body), compression = compression)
+        self.validator = validator if len(validator) > 0 else None
+        return dataframe
+
+    def _read_file(self):
+        # Internal use.  Read the CSV file at any url other than http(s), returning the dataframe, or
+        # None if it's a file which hasn't changed since it was last read
+        validator = _file_validator(self.url)
+        if self.table is not None and validator is not None and validator == self.validator:
+            return None
+        dataframe = pd.read_csv(self.url)
+        self.validator = validator
+        return dataframe
+
+    def _set_dataframe(self, dataframe):
+        # Internal use.  Serve the dataframe read from the CSV file.  The columns of the file are
+        # matched to the schema by position
+        self.dataframe = dataframe
+        # Neither the slice nor the renaming copies the data; DataFrameTable copies the columns
+        # it keeps unless pandas copies on write
+        dataframe = self.dataframe.iloc[:, :len(self.schema)].set_axis(self.column_names(), axis = 1)
+        self.table = DataFrameTable(self.schema, dataframe, self.header_variables)
+
+    def get_columns(self):
+        '''
+        Return the columns of the table, each converted to the type in the schema
+        '''
+        return self._get_table().get_columns()
 
-    def get_rows(self):
-        if self.dataFrame is None:
-            self.dataframe = pd.read_csv(self.url)
-        return self.dataframe.values.tolist()
+    def _get_rows(self):
+        return self._get_table().get_rows()
+
+    def all_values(self, column_name:str):
+        '''
+        get all the values from column_name
+        Arguments:
+
+            column_name: name of the column to get the values for
+
+        Returns:
+            List of the values
+
+        '''
+        return self._get_table().all_values(column_name)
+
+    def _column_array(self, index):
+        # Internal use.  Overrides DataPlaneTable._column_array with the downloaded table's column
+        return self._get_table()._column_array(index)
+
+    def get_filtered_rows(self, filter_spec = None, columns = [], offset = 0, limit = None):
+        '''
+        Filter the rows according to the specification given by filter_spec.
+        Returns the rows for which the resulting filter returns True.
+
+        Arguments:
+            filter_spec: Specification of the filter, as a dictionary
+            columns: the names of the columns to return, in the order given.  Returns all columns if absent
+            offset: the number of passing rows to skip.  Defaults to 0
+            limit: the most rows to return, or None (the default) for all of them
+        Returns:
+            The rows of the table which pass the filter
+        '''
+        return self._get_table().get_filtered_rows(filter_spec, columns, offset, limit)
+
+
+class DataFrameTable(DataPlaneTable):
+    '''
+    A DataPlaneTable which holds its data by column, in a pandas DataFrame.  Each column
+    is converted to the type given in the schema when the table is created, and numeric
+    columns are stored as float64, so filters run as vectorized operations over the
+    columns and projection doesn't touch the columns which weren't asked for.
+    Arguments:
+        schema: the schema of the table.  Each column of the schema must name a column
+            of dataframe
+        dataframe: a pandas DataFrame with the data
+        header_variables: as for DataPlaneTable
+    '''
+
+    def __init__(self, schema, dataframe, header_variables = None):
+        super(DataFrameTable, self).__init__(schema, self._get_rows, header_variables)
+        converted = {}
+        for column in schema:
+            source = dataframe[column["name"]].reset_index(drop = True)
+            if column["type"] == DATA_PLANE_NUMBER and source.dtype == np.float64:
+                # The column is already in the stored form.  Under copy-on-write it's shared with
+                # dataframe rather than copied, and is only copied if one of them is changed
+                converted[column["name"]] = source if _COPY_ON_WRITE else source.copy()
+                continue
+            values = convert_column_to_array(source, {"type": column["type"]})
+            # An array which owns its memory was made by the conversion, and needn't be copied again
+            converted[column["name"]] = pd.Series(values, dtype = float if column["type"] == DATA_PLANE_NUMBER else object, copy = values.base is not None)
+        self.dataframe = pd.DataFrame(converted, copy = False)
+        # The columns as numpy arrays, in schema order.  Filters are evaluated over these,
+        # and the rows which pass are gathered from them
+        self.arrays = [self.dataframe[column["name"]].to_numpy() for column in schema]
+        self.columns = None
+        self.rows = None
+        # The sorted distinct values and the range of each column, computed on first request
+        self._all_values = {}
+        self._range_specs = {}
+        # The data doesn't change after the table is built (see RowTable.data_version)
+        self.data_version = 0
+
+    def get_columns(self):
+        '''
+        Return the columns of the table as lists of values, in schema order
+        '''
+        if self.columns is None:
+            self.columns = [self.dataframe[name].tolist() for name in self.column_names()]
+        return self.columns
+
+    def _get_rows(self):
+        if self.rows is None:
+            self.rows = [list(row) for row in zip(*self.get_columns())]
+        return self.rows
+
+    def _column_array(self, index):
+        # Internal use.  Overrides DataPlaneTable._column_array with the stored column
+        return self.arrays[index]
+
+    def all_values(self, column_name:str):
+        '''
+        get all the values from column_name
+        Arguments:
+
+            column_name: name of the column to get the values for
+
+        Returns:
+            List of the values
+
+        '''
+        self._column_index(column_name)
+        if column_name not in self._all_values:
+            self._all_values[column_name] = _sorted_unique_values(self.dataframe[column_name], self.get_column_type(column_name))
+        return list(self._all_values[column_name])
+
+    def range_spec(self, column_name:str):
+        '''
+        Get the dictionary {min_val, max_val} for column_name.  The range of each column
+        is computed on first request and kept
+        Arguments:
+
+            column_name: name of the column to get the range spec for
+
+        Returns:
+            the minimum and  maximum of the column
+
+        '''
+        if column_name not in self._range_specs:
+            self._range_specs[column_name] = super(DataFrameTable, self).range_spec(column_name)
+        return dict(self._range_specs[column_name])
+
+    def get_filtered_rows(self, filter_spec = None, columns = [], offset = 0, limit = None):
+        '''
+        Filter the rows according to the specification given by filter_spec.
+        Returns the rows for which the resulting filter returns True.
+
+        Arguments:
+            filter_spec: Specification of the filter, as a dictionary
+            columns: the names of the columns to return, in the order given.  Returns all columns if absent
+            offset: the number of passing rows to skip.  Defaults to 0
+            limit: the most rows to return, or None (the default) for all of them
+        Returns:
+            The rows of the table which pass the filter
+        '''
+        if columns is None: columns = []
+        if filter_spec is None and columns == []:
+            return _page(self.get_rows(), offset, limit)
+        column_indices = range(len(self.arrays)) if columns == [] else self._projection_indices(columns)
+        if filter_spec is None:
+            rows = slice(offset, None if limit is None else offset + limit)
+        else:
+            mask = _make_filter(filter_spec, self.schema).filter_mask(self.arrays, len(self.dataframe))
+            rows = _page(np.flatnonzero(mask), offset, limit)
+        if len(column_indices) == 0:
+            # None of the requested columns is a column of the table: as the other tables do,
+            # return an empty row for each row in the page
+            return [[] for i in np.arange(len(self.dataframe))[rows]]
+        # Only the rows in the page are gathered, and only from the requested columns
+        selected = [self.arrays[i][rows] for i in column_indices]
+        return [list(row) for row in zip(*[array.tolist() for array in selected])]
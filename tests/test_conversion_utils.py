@@ -0,0 +1,137 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2019-2021, engageLively
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+'''
+Run tests on the type conversion utilities
+'''
+
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from dataplane.data_plane_utils import DATA_PLANE_BOOLEAN, DATA_PLANE_NUMBER, DATA_PLANE_STRING, DATA_PLANE_DATE, DATA_PLANE_DATETIME, DATA_PLANE_TIME_OF_DAY
+from dataplane.conversion_utils import compile_element_converter, compile_row_converter, convert_column, convert_column_to_array, convert_element, convert_row, convert_rows
+
+# Columns, the conversion object to convert them with, and the expected result.
+# Each column is checked both as a list and as a pandas Series
+conversion_tests = [
+    (['1', '2.5', 'x'], {"type": DATA_PLANE_NUMBER, "default_value": "0"}, [1.0, 2.5, 0.0]),
+    ([1, 2.5], {"type": DATA_PLANE_NUMBER}, [1.0, 2.5]),
+    ([True, 2], {"type": DATA_PLANE_NUMBER}, [1.0, 2.0]),
+    (['True', 'true', 't', 'f'], {"type": DATA_PLANE_BOOLEAN}, [True, True, True, False]),
+    ([0, 2.0], {"type": DATA_PLANE_BOOLEAN}, [False, True]),
+    ([True, False], {"type": DATA_PLANE_BOOLEAN}, [True, False]),
+    ([Decimal('1'), Decimal('0')], {"type": DATA_PLANE_BOOLEAN}, [False, False]),
+    ([Decimal('1.5'), Decimal('0')], {"type": DATA_PLANE_NUMBER}, [1.5, 0.0]),
+    ([1, 'a'], {"type": DATA_PLANE_STRING}, ['1', 'a']),
+    ([[1, 2], [3, 4]], {"type": DATA_PLANE_STRING}, ['[1, 2]', '[3, 4]']),
+    (['1_000', 'x', 2], {"type": DATA_PLANE_NUMBER, "default_value": "0"}, [1000.0, 0.0, 2.0]),
+    (['1', None], {"type": DATA_PLANE_NUMBER, "default_value": "0"}, [1.0, 0.0]),
+    ([1.5, None], {"type": DATA_PLANE_NUMBER, "default_value": "0"}, [1.5, 0.0]),
+    (['2020-01-02', 'bad'], {"type": DATA_PLANE_DATE}, [datetime.date(2020, 1, 2), datetime.date(1900, 1, 1)]),
+    (['01/02/2020', 'bad'], {"type": DATA_PLANE_DATE, "format_string": "%m/%d/%Y"}, [datetime.date(2020, 1, 2), datetime.date(1900, 1, 1)]),
+    (
+        ['01/02/2020', None, datetime.date(2021, 3, 4)], {"type": DATA_PLANE_DATE, "format_string": "%m/%d/%Y"},
+        [datetime.date(2020, 1, 2), datetime.date(1900, 1, 1), datetime.date(2021, 3, 4)]
+    ),
+    (
+        ['01/02/2020 10:30', 'bad'], {"type": DATA_PLANE_DATETIME, "format_string": "%m/%d/%Y %H:%M"},
+        [datetime.datetime(2020, 1, 2, 10, 30), datetime.datetime(1900, 1, 1, 0, 0, 0)]
+    ),
+    (['10:30', 'bad'], {"type": DATA_PLANE_TIME_OF_DAY, "format_string": "%H:%M", "default_value": "12:00"}, [datetime.time(10, 30), datetime.time(12, 0)]),
+    # pandas won't parse mixed offsets, or dates outside its nanosecond range: strptime does
+    (
+        ['2020-01-02 10:30 +0100', '2020-01-03 10:30 -0500'], {"type": DATA_PLANE_DATETIME, "format_string": "%Y-%m-%d %H:%M %z"},
+        [
+            datetime.datetime(2020, 1, 2, 10, 30, tzinfo = datetime.timezone(datetime.timedelta(hours = 1))),
+            datetime.datetime(2020, 1, 3, 10, 30, tzinfo = datetime.timezone(datetime.timedelta(hours = -5)))
+        ]
+    ),
+    (
+        ['01/02/1500', '01/02/2020', ''], {"type": DATA_PLANE_DATE, "format_string": "%m/%d/%Y"},
+        [datetime.date(1500, 1, 2), datetime.date(2020, 1, 2), datetime.date(1900, 1, 1)]
+    ),
+    ([datetime.datetime(2020, 1, 2, 10, 30)], {"type": DATA_PLANE_TIME_OF_DAY}, [datetime.time(10, 30)]),
+    ([datetime.datetime(2020, 1, 2, 10, 30)], {"type": DATA_PLANE_DATE}, [datetime.date(2020, 1, 2)]),
+]
+
+def test_convert_column():
+    for (column, type_conversion_object, expected) in conversion_tests:
+        for values in [column, pd.Series(column, dtype = object)]:
+            result = convert_column(values, type_conversion_object)
+            assert result == expected
+            assert [type(value) for value in result] == [type(value) for value in expected]
+            # the column conversion must agree with converting entry by entry
+            assert [convert_element(value, type_conversion_object) for value in column] == expected
+            assert list(map(compile_element_converter(type_conversion_object), column)) == expected
+
+def test_convert_row():
+    type_conversion_object_list = [
+        {"type": DATA_PLANE_STRING},
+        {"type": DATA_PLANE_NUMBER, "default_value": "0"},
+        {"type": DATA_PLANE_DATE, "format_string": "%m/%d/%Y", "default_value": "12/1/2000"}
+    ]
+    row = [3, 'x', '01/02/2020']
+    expected = ['3', 0.0, datetime.date(2020, 1, 2)]
+    assert convert_row(row, type_conversion_object_list) == expected
+    converters = compile_row_converter(type_conversion_object_list)
+    assert convert_row(row, converters) == expected
+    assert convert_row(['a', '1.5', 'bad'], converters) == ['a', 1.5, datetime.date(2000, 12, 1)]
+
+def test_convert_rows():
+    type_conversion_object_list = [
+        {"type": DATA_PLANE_STRING},
+        {"type": DATA_PLANE_NUMBER, "default_value": "0"},
+        {"type": DATA_PLANE_BOOLEAN}
+    ]
+    rows = [[3, 'x', 'true'], ['a', '1.5', 'f']]
+    assert convert_rows(rows, type_conversion_object_list) == [['3', 0.0, True], ['a', 1.5, False]]
+    assert convert_rows(rows, type_conversion_object_list) == [convert_row(row, type_conversion_object_list) for row in rows]
+    assert convert_rows([], type_conversion_object_list) == []
+
+def test_repeated_strings():
+    # A column with few distinct strings shares one string object per value, or is
+    # a Categorical if asked
+    column = [''.join(['s', 'tate', str(i % 3)]) for i in range(300)]
+    result = convert_column(column, {"type": DATA_PLANE_STRING})
+    assert result == column
+    assert len({id(value) for value in result}) == 3
+    categorical = convert_column(column, {"type": DATA_PLANE_STRING, "categorical": True})
+    assert isinstance(categorical, pd.Categorical)
+    assert list(categorical) == column
+    assert len(categorical.categories) == 3
+
+def test_convert_column_to_array():
+    numbers = convert_column_to_array(['1', '2.5'], {"type": DATA_PLANE_NUMBER})
+    assert numbers.dtype == np.float64 and numbers.tolist() == [1.0, 2.5]
+    booleans = convert_column_to_array(['true', 'f'], {"type": DATA_PLANE_BOOLEAN})
+    assert booleans.dtype == bool and booleans.tolist() == [True, False]
+    dates = convert_column_to_array(['2020-01-02'], {"type": DATA_PLANE_DATE})
+    assert dates.dtype == object and dates.tolist() == [datetime.date(2020, 1, 2)]
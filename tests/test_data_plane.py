@@ -6,3 +6,17 @@
 
 
 # from data_plane import data_plane
+
+import os
+import subprocess
+import sys
+
+
+def test_import_through_package(tmp_path):
+    # The server is imported through the data_plane package, from the directory above it, by
+    # a fresh interpreter which has nothing else on its path
+    os.symlink(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), tmp_path / 'data_plane')
+    environment = {key: value for (key, value) in os.environ.items() if key != 'PYTHONPATH'}
+    command = 'import data_plane.data_plane_server.data_plane_server, data_plane.data_plane_server.data_plane_csv_server'
+    result = subprocess.run([sys.executable, '-c', command], cwd = tmp_path, env = environment, capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
@@ -43,6 +43,11 @@ from app import app
 
 client = app.test_client()
 
+# app imports the server through the data_plane package, so the module which serves the routes
+# isn't data_plane_server.data_plane_server.  Patch and inspect this one
+import sys
+served = sys.modules[app.view_functions['data_plane_server.get_filtered_rows'].__module__]
+
 UNPROTECTED_SPEC = {
     "unprotected": [
         {"name": "column1", "type": "string"},
@@ -84,6 +89,34 @@ def test_get_table_spec():
         assert response.status_code == 200
         assert response.json == result
 
+def test_metadata_etags():
+    # /get_table_spec and /get_tables return an ETag, and a request with a matching
+    # If-None-Match gets a 304.  The ETag is computed from the content, so reinitializing
+    # the server with the same tables keeps it, and changing the tables changes it
+    client.get('/init')
+    for (route, headers) in [('/get_table_spec', {}), ('/get_tables', {}), ('/get_tables', {"foo": "bar"})]:
+        response = client.get(route, headers = headers)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        response = client.get(route, headers = {**headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+    response = client.get('/get_tables')
+    unprotected_etag = response.headers['ETag']
+    response = client.get('/get_tables', headers = {"foo": "bar"})
+    assert response.headers['ETag'] != unprotected_etag
+    spec_etag = client.get('/get_table_spec').headers['ETag']
+    client.get('/init')
+    response = client.get('/get_tables', headers = {'If-None-Match': unprotected_etag})
+    assert response.status_code == 304
+    new_table = RowTable([{"name": "renamed", "type": DATA_PLANE_STRING}], [["a"]])
+    Table = sys.modules[type(served.table_server).__module__].Table
+    served.table_server.add_data_plane_table({"name": "new_table", "table": Table(new_table)})
+    response = client.get('/get_tables', headers = {'If-None-Match': unprotected_etag})
+    assert response.status_code == 200
+    response = client.get('/get_table_spec', headers = {'If-None-Match': spec_etag})
+    assert response.status_code == 200
+    client.get('/init')
+
 def test_all_values_and_range_spec():
     # For get_all_values and get_range_spec, just check the response codes -- 
     # we know the values from testing the table server
@@ -141,12 +174,34 @@ def test_all_values_and_range_spec():
             assert response.status_code == 200
             assert response.json == results[route][column]
 
+def test_get_column_metadata():
+    # /get_column_metadata returns the same values as /get_all_values and /get_range_spec
+    client.get('/init')
+    for body in [{}, {"table": "foo"}, {"table": "test1", "columns": "name"}, {"table": "test1", "columns": ["foo"]}]:
+        response = client.post('get_column_metadata', json = body)
+        assert response.status_code == 400
+    response = client.post('get_column_metadata', json = {"table": "protected"})
+    assert response.status_code == 403
+    response = client.post('get_column_metadata', json = {"table": "test1", "columns": ["time", "date"]})
+    assert response.status_code == 200
+    assert sorted(response.json.keys()) == ["date", "time"]
+    for (column, metadata) in response.json.items():
+        assert metadata["all_values"] == client.get(f'get_all_values?table_name=test1&column_name={column}').json
+        assert metadata["range_spec"] == client.get(f'get_range_spec?table_name=test1&column_name={column}').json
+    response = client.post('get_column_metadata', json = {"table": "unprotected"})
+    assert response.status_code == 200
+    assert response.json["column1"]["range_spec"] == {'max_val': 'Tori', 'min_val': 'Alexandra'}
+
 def test_get_filtered_rows():
     # Check get_filtered_rows
     # Check for a bad table name
     response = client.get('/init')
     response = client.post('/get_filtered_rows', json={})
     assert response.status_code == 400
+    # A body which isn't a JSON object is a 400
+    for body in ['{"table": ', '["test1"]']:
+        response = client.post('/get_filtered_rows', data=body, content_type='application/json')
+        assert response.status_code == 400
     response = client.post('get_filtered_rows', json={'table': 'foo'})
     assert response.status_code == 400
     header_list = [({}, 403), ({"foo": "foo"}, 403), ({"foo": "bar"}, 200) ]
@@ -157,6 +212,8 @@ def test_get_filtered_rows():
     # Bad column
     response = client.post('get_filtered_rows', json=({"table": "test1", "columns": "foo"}))
     assert response.status_code == 400
+    response = client.post('get_filtered_rows', json=({"table": "test1", "columns": [["name"]]}))
+    assert response.status_code == 400
     response = client.post('get_filtered_rows', json=({"table": "test1", "columns": ["foo"]}))
     assert response.status_code == 400
 
@@ -193,3 +250,73 @@ def test_get_filtered_rows():
     response = client.post('get_filtered_rows', json={"table": "test1", "columns": ["datetime"], "filter": filter_spec})
     assert response.status_code == 200
     assert response.json == result
+
+    # Paging through the rows with offset and limit
+    result =  [["Debi" ], ["Catherina" ]]
+    response = client.post('get_filtered_rows', json={"table": "test1", "columns": ["name"], "filter": filter_spec, "offset": 1, "limit": 2})
+    assert response.status_code == 200
+    assert response.json == result
+    response = client.post('get_filtered_rows', json={"table": "test1", "columns": ["name"], "filter": filter_spec, "offset": 4})
+    assert response.status_code == 200
+    assert response.json == [["Deena"]]
+    for bad_page in [{"offset": -1}, {"limit": "2"}, {"limit": True}]:
+        response = client.post('get_filtered_rows', json={"table": "test1", "filter": filter_spec, **bad_page})
+        assert response.status_code == 400
+
+def test_response_without_orjson(monkeypatch):
+    # With or without orjson, the responses are the same JSON.  Without orjson, the
+    # dates, times and datetimes are converted by _isoformat_columns
+    client.get('/init')
+    requests = [{"table": "test1"}, {"table": "test1", "columns": ["date", "time", "datetime"]}]
+    results = [client.post('get_filtered_rows', json=request_body).json for request_body in requests]
+    isoformat_calls = []
+    isoformat_columns = served._isoformat_columns
+    def counting_isoformat_columns(*args):
+        isoformat_calls.append(args)
+        return isoformat_columns(*args)
+    monkeypatch.setattr(served, 'orjson', None)
+    monkeypatch.setattr(served, '_isoformat_columns', counting_isoformat_columns)
+    monkeypatch.setattr(served, '_filtered_rows_cache', {})
+    for (request_body, result) in zip(requests, results):
+        response = client.post('get_filtered_rows', json=request_body)
+        assert response.status_code == 200
+        assert response.json == result
+    assert len(isoformat_calls) == len(requests)
+
+def test_compressed_response(monkeypatch):
+    # Clients which accept gzip get a gzipped response, and the same JSON.  The gzipped body is
+    # kept in the cache entry
+    import gzip
+    monkeypatch.setattr(served, 'zstandard', None)
+    monkeypatch.setattr(served, '_filtered_rows_cache', {})
+    client.get('/init')
+    expected = client.post('get_filtered_rows', json={"table": "test1"}).json
+    for i in range(2):
+        response = client.post('get_filtered_rows', json={"table": "test1"}, headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(response.get_data())) == expected
+    assert [sorted(entry.keys()) for entry in served._filtered_rows_cache.values()] == [['gzip', 'identity']]
+
+def test_filtered_rows_cache(monkeypatch):
+    # Cached responses aren't used after a RowTable's rows are replaced or its cache is
+    # invalidated, and the cache is bounded by the size of the bodies
+    client.get('/init')
+    table = served.table_server.get_table('unprotected')
+    old_rows = table.rows
+    assert client.post('get_filtered_rows', json={"table": "unprotected"}).json == old_rows
+    table.rows = [['Zed', 1]]
+    assert client.post('get_filtered_rows', json={"table": "unprotected"}).json == [['Zed', 1]]
+    table.rows.append(['Ann', 2])
+    table.invalidate_cache()
+    assert client.post('get_filtered_rows', json={"table": "unprotected"}).json == [['Zed', 1], ['Ann', 2]]
+    monkeypatch.setattr(served, '_filtered_rows_cache', {})
+    monkeypatch.setattr(served, '_FILTERED_ROWS_CACHE_BYTES', 100)
+    client.post('get_filtered_rows', json={"table": "test1"})
+    assert len(served._filtered_rows_cache) == 0
+    for name in ['Zed', 'Ann']:
+        spec = {"operator": "IN_LIST", "column": "column1", "values": [name]}
+        client.post('get_filtered_rows', json={"table": "unprotected", "filter": spec})
+    client.post('get_filtered_rows', json={"table": "unprotected"})
+    assert sum(len(body) for entry in served._filtered_rows_cache.values() for body in entry.values()) <= 100
+    client.get('/init')
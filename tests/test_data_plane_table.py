@@ -37,10 +37,11 @@ import math
 import re
 import random
 
+import numpy as np
 import pandas as pd
 import pytest
 from dataplane.data_plane_utils import DATA_PLANE_BOOLEAN, DATA_PLANE_NUMBER, DATA_PLANE_STRING, DATA_PLANE_DATE, DATA_PLANE_DATETIME, DATA_PLANE_TIME_OF_DAY, InvalidDataException
-from dataplane.data_plane_table import DataPlaneFilter, DataPlaneTable, check_valid_spec, DATA_PLANE_FILTER_FIELDS, DATA_PLANE_FILTER_OPERATORS
+from dataplane.data_plane_table import DataPlaneFilter, DataPlaneTable, DataFrameTable, RemoteCSVTable, RowTable, check_valid_spec, DATA_PLANE_FILTER_FIELDS, DATA_PLANE_FILTER_OPERATORS
 
 table_test_1 = {
     "rows": [["Ted", 21], ["Alice", 24]],
@@ -65,6 +66,15 @@ def test_create():
         assert(table.get_column_type(column["name"]) == column["type"])
     assert table.get_column_type(None) == None
     assert table.get_column_type("Foo") == None
+    # If a name is repeated, the first column with that name wins
+    repeated = DataPlaneTable([{"name": "x", "type": DATA_PLANE_STRING}, {"name": "x", "type": DATA_PLANE_NUMBER}], lambda: [["a", 1]])
+    assert repeated.get_column_type("x") == DATA_PLANE_STRING
+
+def test_row_table_from_columns():
+    columns = [["Ted", "Alice"], [21, 24]]
+    table = RowTable.from_columns(table_test_1["schema"], columns)
+    assert table.get_rows() == table_test_1["rows"]
+    assert table.get_columns() == columns
 
 
 def test_all_values_and_range_spec():
@@ -90,6 +100,16 @@ def test_all_values_and_range_spec():
     assert table.range_spec('age') == {'max_val': 24, "min_val": 21}
     table.get_rows = lambda: [['Ted', 21], ['Alice', 24], ['Jane', 20]]
     assert table.range_spec('age') == {'max_val': 24, "min_val": 20}
+    # The range is taken after the values are converted to the column type, as all_values sorts them
+    table.get_rows = lambda: [['Ted', '10'], ['Alice', '9'], ['Jane', '100']]
+    assert table.range_spec('age') == {'max_val': 100, "min_val": 9}
+    assert table.all_values('age') == [9, 10, 100]
+    # A column with no values, or only Nones and NaNs, has no range
+    table.get_rows = lambda: [['Ted', None], ['Alice', float('nan')]]
+    assert table.range_spec('age') == {'max_val': None, "min_val": None}
+    empty_table = DataFrameTable(table_test_1["schema"], pd.DataFrame({"name": pd.Series([], dtype = object), "age": pd.Series([], dtype = object)}))
+    assert empty_table.range_spec('age') == {'max_val': None, "min_val": None}
+    assert empty_table.range_spec('name') == {'max_val': None, "min_val": None}
 
 from dataplane.data_plane_table import _convert_to_type
 import datetime
@@ -128,6 +148,10 @@ def test_convert_to_type():
     for date_string in valid_iso_dates:
         assert datetime.date.fromisoformat(date_string) == _convert_to_type(DATA_PLANE_DATE, date_string)
 
+    # Subclasses of datetime (e.g., pandas Timestamps) are datetimes
+    timestamp = pd.Timestamp('2023-09-11T12:00:00')
+    assert _convert_to_type(DATA_PLANE_DATETIME, timestamp) is timestamp
+
 
 
 def _check_valid_spec_error(bad_filter_spec, error_message):
@@ -420,6 +444,26 @@ def test_in_list_filter():
 def test_regex_filter():
     _test_type("regex_match")
 
+# Large columns match each distinct value once; check that against matching every row
+
+def test_regex_filter_large():
+    large_rows = [[names[i % len(names)]] for i in range(3000)]
+    spec = {"operator": "REGEX_MATCH", "column": "name", "expression": "D.*"}
+    data_plane_filter = DataPlaneFilter(spec, [{"name": "name", "type": DATA_PLANE_STRING}])
+    expected = [row for row in large_rows if re.fullmatch("D.*", row[0]) is not None]
+    assert data_plane_filter.filter(large_rows) == expected
+    array_rows = np.array(large_rows, dtype = object)
+    assert data_plane_filter.filter(array_rows).tolist() == expected
+
+def test_regex_filter_literal():
+    # An expression with no special characters is matched by comparison
+    name = names[0]
+    spec = {"operator": "REGEX_MATCH", "column": "name", "expression": name}
+    data_plane_filter = DataPlaneFilter(spec, schema)
+    assert data_plane_filter.literal == name
+    assert data_plane_filter.filter(rows) == [row for row in rows if row[0] == name]
+    assert DataPlaneFilter({"operator": "REGEX_MATCH", "column": "name", "expression": "D.*"}, schema).literal is None
+
 # Flatten the list of primitive tests to put them all in a single 
 # list, where each item is of the form (spec, expected)
 
@@ -523,6 +567,22 @@ def test_none():
     for test in none_tests:
         _compare_indices(test["spec"], test["expected"])
 
+def test_constant_filters():
+    # Filters which pass every row or no row, whatever the data
+    all_indices = set(range(len(rows)))
+    empty_list = {"operator": "IN_LIST", "column": "name", "values": []}
+    age_range = {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20}
+    _compare_indices(empty_list, set())
+    _compare_indices({"operator": "ALL", "arguments": []}, all_indices)
+    _compare_indices({"operator": "ANY", "arguments": []}, set())
+    _compare_indices({"operator": "NONE", "arguments": []}, all_indices)
+    _compare_indices({"operator": "ALL", "arguments": [age_range, empty_list]}, set())
+    _compare_indices({"operator": "NONE", "arguments": [empty_list]}, all_indices)
+    range_indices = DataPlaneFilter(age_range, schema).filter_index(rows)
+    _compare_indices({"operator": "ANY", "arguments": [age_range, empty_list]}, range_indices)
+    assert DataPlaneFilter({"operator": "ALL", "arguments": [age_range, empty_list]}, schema).constant is False
+    assert DataPlaneFilter({"operator": "ANY", "arguments": [age_range, empty_list]}, schema).constant is None
+
 # Test for a missing filter argument
 
 def test_no_filter():
@@ -536,6 +596,189 @@ def test_get_columns():
     names_only = [[name] for name in names]
     assert names_only == all_rows
 
+# RowTable and DataFrameTable evaluate filters over columns.  They must give the
+# same results as the row-based filters of DataPlaneTable
+
+def _compare_filtered_rows(other_table):
+    # Run the primitive tests, and ALL/ANY/NONE over pairs of them, through table
+    # and other_table and compare the results
+    test_list = _all_primitive_tests()
+    compound_tests = [
+        {"spec": {"operator": operator, "arguments": [test["spec"], test1["spec"]]}}
+        for operator in ['ALL', 'ANY', 'NONE'] for (test, test1) in zip(test_list, test_list[1:])
+    ]
+    for test in test_list + compound_tests:
+        expected = table.get_filtered_rows(filter_spec = test["spec"], columns = ['name', 'age'])
+        assert other_table.get_filtered_rows(filter_spec = test["spec"], columns = ['name', 'age']) == expected
+
+def test_row_table_filter():
+    row_table = RowTable(schema, rows)
+    for column in schema:
+        assert row_table.all_values(column["name"]) == table.all_values(column["name"])
+    _compare_filtered_rows(row_table)
+
+def test_column_order():
+    # The columns of get_filtered_rows come in the order they were asked for
+    spec = {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20}
+    expected = [[row[1], row[0]] for row in table.get_filtered_rows(filter_spec = spec)]
+    dataframe_table = DataFrameTable(schema, pd.DataFrame(rows, columns = [column["name"] for column in schema]))
+    for other_table in [table, RowTable(schema, rows), dataframe_table]:
+        assert other_table.get_filtered_rows(filter_spec = spec, columns = ['age', 'name']) == expected
+        assert other_table.get_filtered_rows(filter_spec = spec, columns = ['age', 'name', 'age', 'foo']) == expected
+
+def test_paging():
+    # offset and limit return a page of the rows get_filtered_rows would return
+    spec = {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20}
+    array_rows = np.empty((len(rows), len(schema)), dtype = object)
+    array_rows[:] = rows
+    dataframe_table = DataFrameTable(schema, pd.DataFrame(rows, columns = [column["name"] for column in schema]))
+    tables = [table, RowTable(schema, rows), dataframe_table, DataPlaneTable(schema, lambda: array_rows)]
+    for other_table in tables:
+        for (filter_spec, columns) in [(spec, ['age', 'name']), (spec, []), (None, ['name']), (None, [])]:
+            expected = table.get_filtered_rows(filter_spec = filter_spec, columns = columns)
+            for (offset, limit) in [(0, None), (2, None), (0, 3), (2, 3), (len(expected), 1)]:
+                page = other_table.get_filtered_rows(filter_spec = filter_spec, columns = columns, offset = offset, limit = limit)
+                page = page.tolist() if isinstance(page, np.ndarray) else page
+                assert page == expected[offset:] if limit is None else page == expected[offset:offset + limit]
+
+def test_filter_cache():
+    # Tables share one filter for each (spec, schema), and a cached filter gives the same rows
+    from dataplane.data_plane_table import _make_filter
+    spec = {"operator": "ALL", "arguments": [
+        {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20},
+        {"operator": "REGEX_MATCH", "column": "name", "expression": "A.*"}
+    ]}
+    same_spec = {"arguments": spec["arguments"], "operator": "ALL"}
+    assert _make_filter(spec, schema) is _make_filter(same_spec, schema)
+    assert _make_filter(spec, schema) is not _make_filter(spec, schema[::-1])
+    first = table.get_filtered_rows(filter_spec = spec)
+    assert table.get_filtered_rows(filter_spec = spec) == first
+    assert first == DataPlaneFilter(spec, schema).filter(rows)
+    with pytest.raises(InvalidDataException):
+        _make_filter({"operator": "IN_RANGE", "column": "foo", "max_val": 30, "min_val": 20}, schema)
+
+def test_array_rows():
+    # A table whose rows are a 2-D numpy array gets its filtered rows as an array
+    array_rows = np.empty((len(rows), len(schema)), dtype = object)
+    array_rows[:] = rows
+    array_table = DataPlaneTable(schema, lambda: array_rows)
+    spec = {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20}
+    result = array_table.get_filtered_rows(filter_spec = spec, columns = ['name', 'age'])
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == table.get_filtered_rows(filter_spec = spec, columns = ['name', 'age'])
+
+def test_remote_csv_table(tmp_path):
+    # The columns of the file are matched to the schema by position, not by name
+    path = tmp_path / 'table.csv'
+    path.write_text('first,second\nTed,21\nAlice,24\nJane,20\n')
+    csv_table = RemoteCSVTable(table_test_1["schema"], str(path))
+    assert csv_table.get_rows() == [['Ted', 21], ['Alice', 24], ['Jane', 20]]
+    assert csv_table.range_spec('age') == {"max_val": 24, "min_val": 20}
+    spec = {"operator": "IN_RANGE", "column": "age", "max_val": 22, "min_val": 20}
+    assert csv_table.get_filtered_rows(spec, ['name']) == [['Ted'], ['Jane']]
+    path.write_text('first,second\nBob,30\n')
+    assert csv_table.get_rows() == [['Ted', 21], ['Alice', 24], ['Jane', 20]]
+    csv_table.reset_dataframe()
+    assert csv_table.get_rows() == [['Bob', 30]]
+
+def test_remote_csv_table_revalidation(tmp_path):
+    # After reset_dataframe, the file is only read and converted again if it has changed: for
+    # http(s), the server answers the conditional GET with a 304 Not Modified
+    import functools, http.server, os, threading
+    path = tmp_path / 'table.csv'
+    path.write_text('first,second\nTed,21\nAlice,24\n')
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory = str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+    try:
+        for url in [str(path), f'http://127.0.0.1:{server.server_address[1]}/table.csv']:
+            path.write_text('first,second\nTed,21\nAlice,24\n')
+            csv_table = RemoteCSVTable(table_test_1["schema"], url)
+            assert csv_table.get_rows() == [['Ted', 21], ['Alice', 24]]
+            table_before = csv_table.table
+            csv_table.reset_dataframe()
+            assert csv_table.get_rows() == [['Ted', 21], ['Alice', 24]]
+            assert csv_table.table is table_before
+            path.write_text('first,second\nBob,30\n')
+            # Last-Modified has a resolution of a second
+            modified = os.stat(path).st_mtime + 10
+            os.utime(path, (modified, modified))
+            csv_table.reset_dataframe()
+            assert csv_table.get_rows() == [['Bob', 30]]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_remote_csv_table_content_encoding():
+    # A response with a gzip Content-Encoding is decompressed, whatever the suffix of the url
+    import gzip, http.server, threading
+    body = gzip.compress(b'first,second\nTed,21\nAlice,24\n')
+    class GzipHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv')
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        def log_message(self, *args):
+            pass
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), GzipHandler)
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+    try:
+        csv_table = RemoteCSVTable(table_test_1["schema"], f'http://127.0.0.1:{server.server_address[1]}/table.csv')
+        assert csv_table.get_rows() == [['Ted', 21], ['Alice', 24]]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_row_table_cache():
+    # The distinct values are cached, and recomputed when the rows are replaced or
+    # the cache is invalidated
+    row_table = RowTable(table_test_1["schema"], [["Ted", 21], ["Alice", 24], ["Ted", 25]])
+    assert row_table.all_values('name') == ['Alice', 'Ted']
+    assert row_table.range_spec('age') == {"max_val": 25, "min_val": 21}
+    row_table.rows = [["Bob", 30]]
+    assert row_table.all_values('name') == ['Bob']
+    assert row_table.range_spec('age') == {"max_val": 30, "min_val": 30}
+    row_table.rows.append(["Carol", 31])
+    assert row_table.all_values('name') == ['Bob']
+    row_table.invalidate_cache()
+    assert row_table.all_values('name') == ['Bob', 'Carol']
+    assert row_table.range_spec('age') == {"max_val": 31, "min_val": 30}
+    assert row_table.get_filtered_rows({"operator": "IN_LIST", "column": "name", "values": ["Carol"]}) == [["Carol", 31]]
+
+def test_dataframe_table():
+    dataframe_table = DataFrameTable(schema, pd.DataFrame(rows, columns = [column["name"] for column in schema]))
+    assert dataframe_table.get_rows() == rows
+    assert dataframe_table.get_filtered_rows(columns=['name']) == [[name] for name in names]
+    assert dataframe_table.all_values('age') == table.all_values('age')
+    _compare_filtered_rows(dataframe_table)
+
+def test_unknown_columns():
+    # Columns which aren't in the table are skipped, so if none of the requested columns is in the
+    # table, every table returns an empty row for each row which passes the filter
+    spec = {"operator": "IN_RANGE", "column": "age", "max_val": 30, "min_val": 20}
+    dataframe = pd.DataFrame(rows, columns = [column["name"] for column in schema])
+    for other_table in [RowTable(schema, rows), DataFrameTable(schema, dataframe)]:
+        for (filter_spec, page) in [(None, {}), (spec, {}), (spec, {"offset": 1, "limit": 2}), (None, {"offset": 1, "limit": 2})]:
+            expected = table.get_filtered_rows(filter_spec = filter_spec, columns = ['name', 'age'], **page)
+            result = other_table.get_filtered_rows(filter_spec = filter_spec, columns = ['Foo'], **page)
+            assert result == [[] for row in expected]
+            assert result == table.get_filtered_rows(filter_spec = filter_spec, columns = ['Foo'], **page)
+
+def test_dataframe_table_shares_columns():
+    # Under copy-on-write (pandas 3), float columns are shared with the source dataframe rather
+    # than copied; under pandas 2 they're copied.  Either way, changing the source afterwards
+    # doesn't change the table.  The source's index is ignored
+    source = pd.DataFrame({"age": [21.0, 24.0, 25.0], "name": ["Ted", "Alice", "Ted"]}, index = [10, 20, 30])
+    dataframe_table = DataFrameTable([{"name": "name", "type": DATA_PLANE_STRING}, {"name": "age", "type": DATA_PLANE_NUMBER}], source)
+    assert np.shares_memory(dataframe_table.arrays[1], source["age"].to_numpy()) == (int(pd.__version__.split('.')[0]) >= 3)
+    source.loc[10, "age"] = 99.0
+    assert dataframe_table.get_rows() == [["Ted", 21.0], ["Alice", 24.0], ["Ted", 25.0]]
+    assert dataframe_table.range_spec("age") == {"max_val": 25.0, "min_val": 21.0}
+
 
 # Test getting all the values from a filter
 
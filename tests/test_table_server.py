@@ -31,6 +31,7 @@
 Run tests on the table server, the middleware that sits between the data plane structures
 and the data plane server
 '''
+import json
 import pytest
 from data_plane_server.table_server import TableServer, TableNotFoundException, TableNotAuthorizedException, ColumnNotFoundException, build_table_spec, Table
 from dataplane.data_plane_table import RowTable
@@ -74,6 +75,15 @@ def test_build_table_spec():
         ["Hitomi", 45]
     ]
 
+def test_build_table_spec_ragged_rows(tmp_path):
+    # Every row must have an entry for each column of the schema
+    schema = [{"name": "column1", "type": "string"}, {"name": "column2", "type": "number"}]
+    for rows in [[["Tom", 23], ["Misha"]], [["Tom", 23], ["Misha", 37, 1]]]:
+        path = tmp_path / 'ragged.json'
+        path.write_text(json.dumps({"name": "ragged", "table": {"schema": schema, "rows": rows}}))
+        with pytest.raises(InvalidDataException):
+            build_table_spec(str(path))
+
 def _check_ok(table, dataplane_table, headers):
     # Utility for test_table() -- just make sure the table is right.
     assert table.table == dataplane_table
@@ -144,6 +154,25 @@ def test_get_table_dictionary():
     assert table_server.get_table_dictionary({'foo': 'bar'}) == dict_expected_protected
 
 
+def test_get_authorized_table_names():
+    # test that the names of the authorized tables are returned
+    assert set(table_server.get_authorized_table_names()) == set(dict_expected_unprotected.keys())
+    assert set(table_server.get_authorized_table_names(None)) == set(dict_expected_unprotected.keys())
+    assert set(table_server.get_authorized_table_names({'foo': 'bar'})) == set(dict_expected_protected.keys())
+
+
+def test_version():
+    # The version changes when a table is added or the server is reinitialized, and
+    # never repeats
+    server = TableServer()
+    versions = [server.version]
+    server.add_data_plane_table(build_table_spec('./tables/unprotected.json'))
+    versions.append(server.version)
+    server.__init__()
+    versions.append(server.version)
+    assert len(set(versions)) == 3
+
+
 def test_get_auth_spec():
     # Test that the authentication specs are returned properly
     assert table_server.get_auth_spec() == {